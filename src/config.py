@@ -143,7 +143,7 @@ class MemoryConfig:
     Memory storage configuration.
     
     Attributes:
-        long_term_file (Path): Persistent JSON storage path
+        long_term_file (Path): Persistent SQLite storage path
         jobs_file (Path): Research jobs tracking file
         query_history_limit (int): Max queries to retain
         auto_cleanup_enabled (bool): Enable periodic cleanup
@@ -151,10 +151,10 @@ class MemoryConfig:
     
     Storage Structure:
         memory/
-            mem.json           - User preferences & history
+            mem.db             - User preferences & history
             jobs.json          - Background job tracking
     """
-    long_term_file: Path = MEMORY_DIR / "mem.json"
+    long_term_file: Path = MEMORY_DIR / "mem.db"
     jobs_file: Path = MEMORY_DIR / "jobs.json"
     query_history_limit: int = 50
     auto_cleanup_enabled: bool = True
@@ -284,7 +284,7 @@ class ObservabilityConfig:
     
     Attributes:
         log_file (Path): Application log file path
-        metrics_file (Path): Performance metrics JSON file
+        metrics_file (Path): Performance metrics NDJSON file
         log_level (str): Logging level (DEBUG, INFO, WARNING, ERROR)
         enable_metrics (bool): Track performance metrics
         enable_console_output (bool): Print to console
@@ -297,7 +297,7 @@ class ObservabilityConfig:
         ERROR:   Error messages (critical issues)
     """
     log_file: Path = LOGS_DIR / "agent.log"
-    metrics_file: Path = LOGS_DIR / "metrics.json"
+    metrics_file: Path = LOGS_DIR / "metrics.ndjson"
     log_level: str = "INFO"
     enable_metrics: bool = True
     enable_console_output: bool = True
@@ -8,10 +8,41 @@ Author: Google Hackathon Team
 License: MIT
 """
 
-import uuid
-from datetime import datetime, timedelta
+import gc
+import heapq
+import logging
+import os
+import random
+import secrets
+import sys
+import time
+from datetime import timedelta
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Set
 
+logger = logging.getLogger(__name__)
+
+
+class Session:
+    """
+    Compact per-session record.
+
+    Metadata lives in __slots__ (a fixed C-level layout, ~56 bytes per
+    instance) while user keys live in the ``data`` dict. Compared to the
+    previous one-dict-per-session layout this avoids paying hash-table
+    entries for the always-present metadata fields, and metadata
+    access is an offset load instead of a hash probe.
+    """
+
+    __slots__ = ('created_at', 'last_updated', 'access_count', 'expires_at', 'data')
+
+    def __init__(self, now: float, ttl_hours: float, data: Optional[Dict[str, Any]] = None):
+        self.created_at = now
+        self.last_updated = now
+        self.access_count = 0
+        self.expires_at = now + ttl_hours * 3600
+        self.data: Dict[str, Any] = {} if data is None else data
+
 
 class SessionMemory:
     """
@@ -32,25 +63,25 @@ class SessionMemory:
     - Ideal for short-lived, high-frequency data
     
     Architecture:
-        - UUID-based session identification
+        - Random hex session identification (secrets.token_hex)
         - Automatic timestamp tracking (created_at, last_updated)
+        - Heap-indexed cleanup: expired sessions found in O(k log n)
         - Session cleanup utilities for memory management
         - Thread-safe single-instance operations
     
     Attributes:
-        store (Dict[str, Dict[str, Any]]): In-memory session data
+        store (Dict[str, Session]): In-memory session records
         SESSION_ID_LENGTH (int): Character length for session IDs
         DEFAULT_TTL_HOURS (int): Default time-to-live for sessions
     
     Storage Structure:
         {
-            "abc123de": {
-                "created_at": "2024-01-15T14:30:00.123456",
-                "last_updated": "2024-01-15T14:35:00.123456",
-                "user_query": "What is AI?",
-                "research_results": {...},
-                "conversation_history": [...]
-            }
+            "abc123de": Session(
+                created_at=1705329000.123456,   # epoch seconds
+                last_updated=1705329300.123456,  # epoch seconds
+                access_count=7,
+                data={"user_query": "What is AI?", ...}
+            )
         }
     
     Example Usage:
@@ -68,7 +99,7 @@ class SessionMemory:
     
     Performance:
         - O(1) average case for get/set operations
-        - O(n) for cleanup operations (n = number of sessions)
+        - O(k log n) for cleanup operations (k = expired sessions)
         - No disk I/O latency
         - Memory footprint depends on stored data volume
     
@@ -76,49 +107,82 @@ class SessionMemory:
         Not thread-safe. Use external locking for concurrent access.
     
     Dependencies:
-        - uuid: Session ID generation
-        - datetime: Timestamp tracking and TTL calculations
+        - secrets: Session ID generation
+        - time: Epoch timestamp tracking and TTL calculations
     """
     
     # Configuration constants
-    SESSION_ID_LENGTH = 8       # Short UUID length for readability
+    SESSION_ID_LENGTH = 8       # Hex chars per session ID (must be even)
     DEFAULT_TTL_HOURS = 24      # Default session lifetime in hours
+    MAX_SESSIONS = 10_000       # Size cap before sampled eviction kicks in
     
-    # Reserved keys (automatically managed)
-    RESERVED_KEYS = {'created_at', 'last_updated', 'access_count'}
+    # Reserved keys (automatically managed). frozenset: immutable, hashed
+    # once. The hot callsites in set/delete_key test against an inline
+    # constant tuple instead, which CPython compiles to a straight
+    # comparison chain.
+    RESERVED_KEYS = frozenset({'created_at', 'last_updated', 'access_count'})
     
-    def __init__(self):
+    def __init__(self, max_sessions: int = MAX_SESSIONS):
         """
         Initialize session memory with empty storage.
         
         Creates an empty in-memory store ready to hold session data.
         All data exists only in RAM and is lost on program termination.
         
+        Args:
+            max_sessions (int): Hard cap on concurrently held sessions.
+                When reached, new_session evicts the least recently
+                updated session from a random 10% sample.
+        
         Example:
             >>> memory = SessionMemory()
             >>> print(f"Active sessions: {len(memory.list_sessions())}")
             Active sessions: 0
         """
-        self.store: Dict[str, Dict[str, Any]] = {}
-        
-        print("[SessionMemory] ✓ Initialized")
-        print(f"[SessionMemory] Session ID length: {self.SESSION_ID_LENGTH} chars")
-        print(f"[SessionMemory] Default TTL: {self.DEFAULT_TTL_HOURS} hours")
+        self.store: Dict[str, Session] = {}
+        self.max_sessions = max_sessions
+        
+        # Running totals so get_statistics is O(1) instead of rescanning
+        # every session; maintained by every path that adds or removes data
+        self._total_keys = 0
+        self._total_accesses = 0
+        
+        # Free-list of cleared user-data dicts recycled between sessions.
+        # Reusing a dict keeps its already-grown hash table, avoiding a
+        # malloc/free pair per session churn cycle.
+        self._dict_pool: List[Dict[str, Any]] = []
+        
+        # Min-heaps of (timestamp, sid) used as lazy indexes so cleanup only
+        # inspects the expired prefix instead of scanning every session.
+        # Stale entries (session deleted or touched since) are skipped on pop,
+        # and _maybe_compact rebuilds the heaps once stale entries dominate
+        # so the indexes stay proportional to the live session count.
+        self._by_created: List[tuple] = []
+        self._by_updated: List[tuple] = []
+        
+        logger.info("[SessionMemory] ✓ Initialized")
+        logger.info("[SessionMemory] Session ID length: %s chars", self.SESSION_ID_LENGTH)
+        logger.info("[SessionMemory] Default TTL: %s hours", self.DEFAULT_TTL_HOURS)
     
-    def new_session(self) -> str:
+    def new_session(self, ttl_hours: float = DEFAULT_TTL_HOURS) -> str:
         """
         Create a new session with unique identifier.
         
         Generates a unique session ID and initializes the session with
         metadata timestamps. The session is immediately ready for use.
         
+        Args:
+            ttl_hours (float): Session lifetime. Expired sessions are
+                dropped lazily on their next access — no sweep required.
+        
         Returns:
-            str: Unique session identifier (8-character UUID)
+            str: Unique session identifier (8 hex characters)
         
         Session Initialization:
-            - created_at: ISO timestamp of session creation
-            - last_updated: ISO timestamp (initially same as created_at)
+            - created_at: Epoch timestamp of session creation
+            - last_updated: Epoch timestamp (initially same as created_at)
             - access_count: Number of get/set operations (starts at 0)
+            - expires_at: Epoch timestamp after which the session is dead
         
         Example:
             >>> memory = SessionMemory()
@@ -127,18 +191,28 @@ class SessionMemory:
             >>> print(sid1 == sid2)
             False  # Each session has unique ID
         """
-        # Generate short UUID for readability
-        sid = str(uuid.uuid4())[:self.SESSION_ID_LENGTH]
-        
-        # Initialize session with metadata
-        now = datetime.now().isoformat()
-        self.store[sid] = {
-            'created_at': now,
-            'last_updated': now,
-            'access_count': 0
-        }
-        
-        print(f"[SessionMemory] ✓ NEW session created: {sid}")
+        # Keep memory bounded: evict before inserting when at capacity
+        if len(self.store) >= self.max_sessions:
+            self._evict_sampled()
+        
+        # 8 hex chars straight from the OS CSPRNG — no intermediate UUID
+        # object or hyphenated string to build and slice. Retry on the
+        # (birthday-paradox) collision so an existing session is never
+        # silently overwritten.
+        while True:
+            sid = secrets.token_hex(self.SESSION_ID_LENGTH // 2)
+            if sid not in self.store:
+                break
+        
+        # Initialize session with metadata, reusing a pooled data dict
+        now = time.time()
+        data = self._dict_pool.pop() if self._dict_pool else None
+        self.store[sid] = Session(now, ttl_hours, data)
+        heapq.heappush(self._by_created, (now, sid))
+        heapq.heappush(self._by_updated, (now, sid))
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SessionMemory] ✓ NEW session created: %s", sid)
         return sid
     
     def get(self, sid: str, key: str, default: Any = None) -> Any:
@@ -155,6 +229,7 @@ class SessionMemory:
         
         Behavior:
             - Returns default if session doesn't exist
+            - Returns default (and reaps the session) if its TTL expired
             - Returns default if key doesn't exist in session
             - Increments access counter
             - Does NOT update last_updated timestamp (read operation)
@@ -169,23 +244,36 @@ class SessionMemory:
             >>> print(unknown)
             25
         """
+        # Intern the key so repeated lookups compare by pointer identity
+        key = sys.intern(key)
+        
         # Check if session exists
-        if sid not in self.store:
-            print(f"[SessionMemory] ⚠ GET session={sid}, key={key}: Session not found, returning default")
+        sess = self.store.get(sid)
+        if sess is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] ⚠ GET session=%s, key=%s: Session not found, returning default", sid, key)
+            return default
+        
+        # Lazy TTL expiration: reap on access instead of waiting for a sweep
+        if sess.expires_at < time.time():
+            self._drop(sid, sess)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] ⚠ GET session=%s: Session expired, returning default", sid)
             return default
         
         # Increment access counter
-        self.store[sid]['access_count'] = self.store[sid].get('access_count', 0) + 1
+        sess.access_count += 1
+        self._total_accesses += 1
         
         # Retrieve value
-        value = self.store[sid].get(key, default)
-        
-        # Log with truncated value for readability
-        value_str = str(value)[:50]
-        if len(str(value)) > 50:
-            value_str += "..."
-        
-        print(f"[SessionMemory] GET session={sid}, key={key}: {value_str}")
+        value = sess.data.get(key, default)
+        
+        # Build the truncated value preview only when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            value_str = str(value)
+            if len(value_str) > 50:
+                value_str = value_str[:50] + "..."
+            logger.debug("[SessionMemory] GET session=%s, key=%s: %s", sid, key, value_str)
         return value
     
     def set(self, sid: str, key: str, value: Any) -> None:
@@ -213,50 +301,72 @@ class SessionMemory:
             >>> memory.set(sid, "results", {"data": [1, 2, 3]})
             >>> memory.set(sid, "step", 1)
         """
-        # Prevent overriding reserved keys
-        if key in self.RESERVED_KEYS:
-            print(f"[SessionMemory] ⚠ Cannot override reserved key: {key}")
+        # Prevent overriding reserved keys (constant tuple: fast-path)
+        if key in ('created_at', 'last_updated', 'access_count'):
+            logger.warning("[SessionMemory] ⚠ Cannot override reserved key: %s", key)
             return
         
-        # Create session if it doesn't exist
-        if sid not in self.store:
-            now = datetime.now().isoformat()
-            self.store[sid] = {
-                'created_at': now,
-                'last_updated': now,
-                'access_count': 0
-            }
-            print(f"[SessionMemory] Auto-created session: {sid}")
-        
-        # Store value
-        self.store[sid][key] = value
-        
-        # Update metadata
-        self.store[sid]['last_updated'] = datetime.now().isoformat()
-        self.store[sid]['access_count'] = self.store[sid].get('access_count', 0) + 1
-        
-        # Log with truncated value
-        value_str = str(value)[:50]
-        if len(str(value)) > 50:
-            value_str += "..."
+        # Intern the key: sessions tend to reuse the same small set of key
+        # names ("query", "results", ...), so identical keys across sessions
+        # share one string object and dict probes short-circuit on identity
+        key = sys.intern(key)
         
-        print(f"[SessionMemory] SET session={sid}, key={key}: {value_str}")
+        now = time.time()
+
+        # Single lookup: fetch the session once, creating it lazily only on
+        # the rare miss instead of re-probing the store for every mutation
+        sess = self.store.get(sid)
+        if sess is not None and sess.expires_at < now:
+            # Lazy TTL expiration: a write to a dead session starts a new one
+            self._drop(sid, sess)
+            sess = None
+        if sess is None:
+            data = self._dict_pool.pop() if self._dict_pool else None
+            sess = Session(now, self.DEFAULT_TTL_HOURS, data)
+            self.store[sid] = sess
+            heapq.heappush(self._by_created, (now, sid))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] Auto-created session: %s", sid)
+
+        # Store value and update metadata
+        if key not in sess.data:
+            self._total_keys += 1
+        sess.data[key] = value
+        sess.last_updated = now
+        sess.access_count += 1
+        self._total_accesses += 1
+        heapq.heappush(self._by_updated, (now, sid))
+        self._maybe_compact()
+        
+        # Build the truncated value preview only when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            value_str = str(value)
+            if len(value_str) > 50:
+                value_str = value_str[:50] + "..."
+            logger.debug("[SessionMemory] SET session=%s, key=%s: %s", sid, key, value_str)
     
-    def get_all(self, sid: str) -> Dict[str, Any]:
+    def get_all(self, sid: str, copy: bool = True) -> Dict[str, Any]:
         """
         Retrieve all data for a session.
         
         Args:
             sid (str): Session identifier
+            copy (bool): If True (default), return a fresh dict merging
+                metadata with the user data. If False, return a zero-copy
+                read-only view of the live user data only — no metadata
+                fields and no per-call allocation, for hot read paths like
+                rendering the current context every turn.
         
         Returns:
-            Dict[str, Any]: Complete session data including metadata.
-                           Empty dict if session doesn't exist.
+            Dict[str, Any]: Complete session data including metadata
+                           (copy=True), or a read-only user-data view
+                           (copy=False). Empty dict if session doesn't
+                           exist or its TTL has expired.
         
-        Includes:
+        Includes (copy=True):
             - All user-stored key-value pairs
-            - created_at: Session creation timestamp
-            - last_updated: Last modification timestamp
+            - created_at: Session creation timestamp (epoch seconds)
+            - last_updated: Last modification timestamp (epoch seconds)
             - access_count: Number of operations
         
         Example:
@@ -267,15 +377,36 @@ class SessionMemory:
             >>> print(data.keys())
             dict_keys(['created_at', 'last_updated', 'access_count', 'name', 'age'])
         """
-        session_data = self.store.get(sid, {})
-        
-        if session_data:
-            print(f"[SessionMemory] GET_ALL session={sid}: {len(session_data)} keys")
-        else:
-            print(f"[SessionMemory] ⚠ GET_ALL session={sid}: Session not found")
-        
-        # Return copy to prevent external modification
-        return session_data.copy()
+        sess = self.store.get(sid)
+        
+        if sess is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] ⚠ GET_ALL session=%s: Session not found", sid)
+            return {}
+        
+        # Lazy TTL expiration, same as get()/set(): the pipeline reads
+        # context through get_all, so a dead session must not serve its
+        # full data here while get() on the same sid returns the default
+        if sess.expires_at < time.time():
+            self._drop(sid, sess)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] ⚠ GET_ALL session=%s: Session expired", sid)
+            return {}
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SessionMemory] GET_ALL session=%s: %s keys", sid, len(sess.data) + 3)
+        
+        if not copy:
+            # Zero-copy read-only view of the live user data
+            return MappingProxyType(sess.data)
+        
+        # Merge metadata with a copy of the user data
+        return {
+            'created_at': sess.created_at,
+            'last_updated': sess.last_updated,
+            'access_count': sess.access_count,
+            **sess.data
+        }
     
     def delete(self, sid: str) -> bool:
         """
@@ -300,17 +431,20 @@ class SessionMemory:
             >>> memory.get(sid, "data")
             None  # Session no longer exists
         """
-        if sid in self.store:
+        sess = self.store.get(sid)
+        if sess is not None:
             # Get session info before deletion
-            key_count = len(self.store[sid])
+            key_count = len(sess.data) + 3
             
             # Delete session
-            del self.store[sid]
+            self._drop(sid, sess)
             
-            print(f"[SessionMemory] ✓ DELETED session={sid} ({key_count} keys)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] ✓ DELETED session=%s (%s keys)", sid, key_count)
             return True
         else:
-            print(f"[SessionMemory] ⚠ DELETE session={sid}: Session not found")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] ⚠ DELETE session=%s: Session not found", sid)
             return False
     
     def delete_key(self, sid: str, key: str) -> bool:
@@ -333,17 +467,25 @@ class SessionMemory:
             >>> memory.delete_key(sid, "temp_data")
             True
         """
-        if key in self.RESERVED_KEYS:
-            print(f"[SessionMemory] ⚠ Cannot delete reserved key: {key}")
+        # Constant tuple fast-path, same as in set()
+        if key in ('created_at', 'last_updated', 'access_count'):
+            logger.warning("[SessionMemory] ⚠ Cannot delete reserved key: %s", key)
             return False
         
-        if sid in self.store and key in self.store[sid]:
-            del self.store[sid][key]
-            self.store[sid]['last_updated'] = datetime.now().isoformat()
-            print(f"[SessionMemory] ✓ DELETED key={key} from session={sid}")
+        sess = self.store.get(sid)
+        if sess is not None and key in sess.data:
+            del sess.data[key]
+            self._total_keys -= 1
+            now = time.time()
+            sess.last_updated = now
+            heapq.heappush(self._by_updated, (now, sid))
+            self._maybe_compact()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] ✓ DELETED key=%s from session=%s", key, sid)
             return True
         else:
-            print(f"[SessionMemory] ⚠ Key={key} not found in session={sid}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SessionMemory] ⚠ Key=%s not found in session=%s", key, sid)
             return False
     
     def list_sessions(self) -> List[str]:
@@ -362,7 +504,8 @@ class SessionMemory:
             2
         """
         sessions = list(self.store.keys())
-        print(f"[SessionMemory] LIST: {len(sessions)} active session(s)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SessionMemory] LIST: %s active session(s)", len(sessions))
         return sessions
     
     def exists(self, sid: str) -> bool:
@@ -373,7 +516,7 @@ class SessionMemory:
             sid (str): Session identifier to check
         
         Returns:
-            bool: True if session exists, False otherwise
+            bool: True if session exists and has not expired, False otherwise
         
         Example:
             >>> sid = memory.new_session()
@@ -382,8 +525,14 @@ class SessionMemory:
             >>> memory.exists("invalid_id")
             False
         """
-        exists = sid in self.store
-        print(f"[SessionMemory] EXISTS session={sid}: {exists}")
+        sess = self.store.get(sid)
+        if sess is not None and sess.expires_at < time.time():
+            # Lazy TTL expiration, consistent with get()/set()/get_all()
+            self._drop(sid, sess)
+            sess = None
+        exists = sess is not None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SessionMemory] EXISTS session=%s: %s", sid, exists)
         return exists
     
     def get_session_age(self, sid: str) -> Optional[timedelta]:
@@ -404,19 +553,45 @@ class SessionMemory:
             >>> print(f"Age: {age.total_seconds():.1f}s")
             Age: 2.0s
         """
-        if sid not in self.store:
-            return None
-        
-        created_str = self.store[sid].get('created_at')
-        if not created_str:
+        sess = self.store.get(sid)
+        if sess is None:
             return None
         
-        created_at = datetime.fromisoformat(created_str)
-        age = datetime.now() - created_at
+        age = timedelta(seconds=time.time() - sess.created_at)
         
-        print(f"[SessionMemory] Session {sid} age: {age}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SessionMemory] Session %s age: %s", sid, age)
         return age
     
+    def _maybe_compact(self) -> None:
+        """
+        Rebuild the heap indexes once stale entries dominate them.
+
+        Every set() pushes a fresh (timestamp, sid) tuple, and the lazy
+        design only discards superseded tuples when a cleanup method
+        pops them — which a long-lived process may never call. Rebuild
+        from the live store whenever either heap grows past twice the
+        session count (with a small floor so tiny stores don't rebuild
+        constantly), keeping the indexes O(live sessions) instead of
+        O(total writes). Amortized cost is O(1) per write.
+        """
+        limit = 2 * max(len(self.store), 64)
+        if len(self._by_updated) > limit or len(self._by_created) > limit:
+            self._compact_heaps()
+
+    def _compact_heaps(self) -> None:
+        """
+        Rebuild both heap indexes from the live sessions.
+
+        Drops every stale tuple (deleted sessions, superseded
+        timestamps) in one pass; heapify is O(n) on the live count.
+        """
+        items = self.store.items()
+        self._by_created = [(sess.created_at, sid) for sid, sess in items]
+        self._by_updated = [(sess.last_updated, sid) for sid, sess in items]
+        heapq.heapify(self._by_created)
+        heapq.heapify(self._by_updated)
+
     def cleanup_old_sessions(self, max_age_hours: int = DEFAULT_TTL_HOURS) -> int:
         """
         Remove sessions older than specified age.
@@ -437,30 +612,29 @@ class SessionMemory:
             >>> deleted = memory.cleanup_old_sessions(max_age_hours=1)
             >>> print(f"Cleaned up {deleted} old sessions")
         """
-        max_age = timedelta(hours=max_age_hours)
-        now = datetime.now()
-        to_delete = []
-        
-        # Find old sessions
-        for sid, data in self.store.items():
-            created_str = data.get('created_at')
-            if created_str:
-                created_at = datetime.fromisoformat(created_str)
-                age = now - created_at
-                
-                if age > max_age:
-                    to_delete.append(sid)
-        
-        # Delete old sessions
-        for sid in to_delete:
-            del self.store[sid]
-        
-        if to_delete:
-            print(f"[SessionMemory] ✓ CLEANUP: Deleted {len(to_delete)} session(s) older than {max_age_hours}h")
-        else:
-            print(f"[SessionMemory] CLEANUP: No sessions older than {max_age_hours}h")
-        
-        return len(to_delete)
+        cutoff = time.time() - max_age_hours * 3600
+        
+        # Pop the expired prefix of the creation-time heap. An entry is
+        # only authoritative if its timestamp still matches the live
+        # session: lazy expiry can drop and re-create a session under
+        # the same sid, and the stale entry must not evict the new one.
+        victims = []
+        heap = self._by_created
+        while heap and heap[0][0] < cutoff:
+            ts, sid = heapq.heappop(heap)
+            sess = self.store.get(sid)
+            if sess is not None and sess.created_at == ts:
+                victims.append(sid)
+        
+        self._evict(victims)
+        deleted = len(victims)
+        
+        if deleted:
+            logger.info("[SessionMemory] ✓ CLEANUP: Deleted %s session(s) older than %sh", deleted, max_age_hours)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SessionMemory] CLEANUP: No sessions older than %sh", max_age_hours)
+        
+        return deleted
     
     def cleanup_inactive_sessions(self, inactive_hours: int = 2) -> int:
         """
@@ -475,31 +649,109 @@ class SessionMemory:
         Example:
             >>> deleted = memory.cleanup_inactive_sessions(inactive_hours=1)
         """
-        max_inactive = timedelta(hours=inactive_hours)
-        now = datetime.now()
-        to_delete = []
-        
-        # Find inactive sessions
-        for sid, data in self.store.items():
-            updated_str = data.get('last_updated')
-            if updated_str:
-                last_updated = datetime.fromisoformat(updated_str)
-                inactive_time = now - last_updated
-                
-                if inactive_time > max_inactive:
-                    to_delete.append(sid)
-        
-        # Delete inactive sessions
-        for sid in to_delete:
-            del self.store[sid]
-        
-        if to_delete:
-            print(f"[SessionMemory] ✓ CLEANUP: Deleted {len(to_delete)} inactive session(s) (>{inactive_hours}h)")
-        else:
-            print(f"[SessionMemory] CLEANUP: No inactive sessions (>{inactive_hours}h)")
-        
-        return len(to_delete)
+        cutoff = time.time() - inactive_hours * 3600
+        
+        # Pop the expired prefix of the activity heap. An entry is only
+        # authoritative if its timestamp still matches the session's
+        # last_updated; otherwise the session was touched since and a newer
+        # heap entry covers it.
+        victims = []
+        heap = self._by_updated
+        while heap and heap[0][0] < cutoff:
+            ts, sid = heapq.heappop(heap)
+            sess = self.store.get(sid)
+            if sess is not None and sess.last_updated == ts:
+                victims.append(sid)
+        
+        self._evict(victims)
+        deleted = len(victims)
+        
+        if deleted:
+            logger.info("[SessionMemory] ✓ CLEANUP: Deleted %s inactive session(s) (>%sh)", deleted, inactive_hours)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SessionMemory] CLEANUP: No inactive sessions (>%sh)", inactive_hours)
+        
+        return deleted
     
+    def _evict_sampled(self) -> None:
+        """
+        Evict the stalest session from a random sample.
+
+        Inspects only a random 10% of session IDs (at least one) and
+        removes the one with the oldest last_updated — the v-LRU sampling
+        strategy. Avoids sorting or scanning the whole store while still
+        preferentially dropping idle sessions.
+        """
+        sample = random.sample(list(self.store.keys()),
+                               max(1, len(self.store) // 10))
+        victim = min(sample, key=lambda s: self.store[s].last_updated)
+        self._drop(victim, self.store[victim])
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SessionMemory] ⚠ EVICTED session=%s (store at capacity %s)",
+                         victim, self.max_sessions)
+
+    def _drop(self, sid: str, sess: Session) -> None:
+        """
+        Remove one session and roll its contribution out of the totals.
+
+        Args:
+            sid (str): Session identifier (must exist in store)
+            sess (Session): The session record being removed
+        """
+        self._total_keys -= len(sess.data)
+        self._total_accesses -= sess.access_count
+        del self.store[sid]
+        self._recycle(sess.data)
+
+    def _recycle(self, data: Dict[str, Any]) -> None:
+        """
+        Clear a released user-data dict and park it on the free-list.
+
+        The pool is capped at 64 dicts so a burst of deletions can't pin
+        memory indefinitely.
+
+        Args:
+            data (Dict[str, Any]): The dict released by a removed session
+        """
+        if len(self._dict_pool) < 64:
+            data.clear()
+            self._dict_pool.append(data)
+
+    def _evict(self, victims: List[str]) -> None:
+        """
+        Remove the given sessions from the store.
+
+        Uses per-key deletes for small batches, but rebuilds the dict in one
+        comprehension when more than half the sessions are going away:
+        CPython dicts never shrink on delete, so a mass expiry would
+        otherwise leave the old oversized hash table behind.
+
+        Args:
+            victims (List[str]): Session IDs to remove (must exist in store)
+        """
+        # Defensive dedupe: a repeated sid would double-decrement the
+        # running totals and recycle the same data dict twice, leaving
+        # two future sessions sharing one dict
+        if len(victims) > 1:
+            victims = list(dict.fromkeys(victims))
+        
+        for sid in victims:
+            sess = self.store[sid]
+            self._total_keys -= len(sess.data)
+            self._total_accesses -= sess.access_count
+            self._recycle(sess.data)
+        
+        if len(victims) > len(self.store) // 2:
+            victim_set = set(victims)
+            self.store = {
+                sid: sess for sid, sess in self.store.items()
+                if sid not in victim_set
+            }
+        else:
+            for sid in victims:
+                del self.store[sid]
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Generate statistics about active sessions.
@@ -528,25 +780,28 @@ class SessionMemory:
                 'total_accesses': 0
             }
         
-        total_keys = sum(len(data) - 3 for data in self.store.values())  # Exclude metadata
-        total_accesses = sum(data.get('access_count', 0) for data in self.store.values())
-        
-        # Find oldest and newest
-        sessions_by_age = sorted(
-            self.store.items(),
-            key=lambda x: x[1].get('created_at', '')
-        )
-        
-        oldest_sid = sessions_by_age[0][0] if sessions_by_age else None
-        newest_sid = sessions_by_age[-1][0] if sessions_by_age else None
+        # Totals are maintained incrementally on every mutation, so only the
+        # age extremes need a pass over the store
+        oldest_sid = newest_sid = None
+        oldest_ts = float('inf')
+        newest_ts = float('-inf')
+
+        for sid, sess in self.store.items():
+            created = sess.created_at
+            if created < oldest_ts:
+                oldest_ts = created
+                oldest_sid = sid
+            if created > newest_ts:
+                newest_ts = created
+                newest_sid = sid
         
         stats = {
             'total_sessions': len(self.store),
-            'total_keys': total_keys,
-            'avg_keys_per_session': total_keys / len(self.store) if self.store else 0,
+            'total_keys': self._total_keys,
+            'avg_keys_per_session': self._total_keys / len(self.store) if self.store else 0,
             'oldest_session': oldest_sid,
             'newest_session': newest_sid,
-            'total_accesses': total_accesses
+            'total_accesses': self._total_accesses
         }
         
         return stats
@@ -567,22 +822,55 @@ class SessionMemory:
         """
         count = len(self.store)
         self.store.clear()
-        print(f"[SessionMemory] ⚠ CLEARED all data ({count} sessions)")
+        self._by_created.clear()
+        self._by_updated.clear()
+        self._total_keys = 0
+        self._total_accesses = 0
+        logger.warning("[SessionMemory] ⚠ CLEARED all data (%s sessions)", count)
         return count
 
 
 # Module-level utility functions
+def tune_gc_thresholds(gen0: int = 7000, gen1: int = 10, gen2: int = 10) -> None:
+    """
+    Raise the cyclic GC collection thresholds for request-serving workloads.
+
+    The default gen0 threshold (700 allocations) makes the collector run
+    very frequently in processes that churn many small per-session dicts.
+    A 10x higher threshold trades slightly later collection for far fewer
+    pauses on the request path.
+
+    Args:
+        gen0 (int): Allocations minus deallocations before a gen0 pass
+        gen1 (int): Gen0 passes before a gen1 pass
+        gen2 (int): Gen1 passes before a gen2 pass
+    """
+    gc.set_threshold(gen0, gen1, gen2)
+    logger.info("[SessionMemory] GC thresholds set to (%s, %s, %s)", gen0, gen1, gen2)
+
+
 def create_session_memory() -> SessionMemory:
     """
     Factory function to create SessionMemory instance.
     
+    After initialization, moves all objects allocated so far into the
+    permanent GC generation via gc.freeze() so the collector stops
+    rescanning long-lived startup state on every pass. Set the
+    SESSION_MEMORY_FREEZE environment variable to "0" to disable.
+    
     Returns:
         SessionMemory: Initialized session memory
     
     Example:
         >>> memory = create_session_memory()
     """
-    return SessionMemory()
+    memory = SessionMemory()
+    
+    if os.environ.get("SESSION_MEMORY_FREEZE", "1") == "1":
+        gc.freeze()
+        logger.info("[SessionMemory] gc.freeze() applied to startup objects")
+    
+    return memory
 
 
 if __name__ == "__main__":
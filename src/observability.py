@@ -8,14 +8,49 @@ Author: Google Hackathon Team
 License: MIT
 """
 
+import atexit
+import bisect
+import functools
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import time
+from collections import Counter, defaultdict, deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from threading import Lock
+from threading import Event, Lock, Thread
+
+# orjson (Rust) serializes/deserializes several times faster than the
+# stdlib and allocates less; fall back to stdlib json when unavailable
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    
+    _json_loads = json.loads
+
+# Log levels pre-resolved at import: replaces a per-init string upper +
+# getattr chain with a dict lookup
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+# File handlers cached per path: repeated logger setups (tests calling
+# reset_global_logger) reuse one open descriptor instead of leaking FDs
+_HANDLER_CACHE: Dict[Path, logging.FileHandler] = {}
 
 
 class ObservabilityLogger:
@@ -51,6 +86,8 @@ class ObservabilityLogger:
     
     Architecture:
         - Thread-safe operations via Lock
+        - Queued logging: producers enqueue records, a background
+          listener thread does all formatting and I/O
         - Dual logging (file + console)
         - Structured metrics format
         - Automatic directory creation
@@ -69,7 +106,8 @@ class ObservabilityLogger:
                 "QueryUnderstandingAgent": {"success": 5, "failure": 0}
             },
             "agent_timings_avg": {
-                "ResearchAgent": {"avg": 3.2, "min": 2.1, "max": 5.0, "count": 5}
+                "ResearchAgent": {"avg": 3.2, "min": 2.1, "max": 5.0,
+                                  "total": 16.0, "count": 5}
             },
             "total_errors": 2,
             "errors": [...]
@@ -103,6 +141,18 @@ class ObservabilityLogger:
     METRICS_RETENTION = 50      # Number of sessions to retain
     MAX_ERRORS_DISPLAYED = 10   # Errors shown in summary
     RECENT_ERRORS_SAVED = 10    # Recent errors saved to file
+    MAX_EVENTS_KEPT = 10_000    # Event ring buffer size (counts stay exact)
+    SAMPLE_RATE_THRESHOLD = 100  # Events/sec per type before body sampling
+    SAMPLE_KEEP_1_IN = 10       # Bodies stored per type once sampling is on
+    
+    # Pre-computed %-style log formats: argument interpolation is deferred
+    # until a handler actually accepts the record, so a raised log level
+    # reduces these calls to a single integer compare
+    _START_FMT = '▶️  Starting %s'
+    _DONE_FMT = '✅ %s completed in %.2fs'
+    _FAIL_FMT = '❌ %s failed in %.2fs: %s'
+    FLUSH_DEBOUNCE = 5.0        # Seconds to coalesce metric flushes
+    EMA_ALPHA = 0.1             # Weight of newest sample in the moving avg
     
     def __init__(
         self,
@@ -123,31 +173,103 @@ class ObservabilityLogger:
         
         # Set file paths
         self.log_file = log_file or (project_root / 'logs' / 'agent.log')
-        self.metrics_file = metrics_file or (project_root / 'logs' / 'metrics.json')
+        self.metrics_file = metrics_file or (project_root / 'logs' / 'metrics.ndjson')
         
-        # Setup logging
+        # Setup logging. All instance logging goes through a named module
+        # logger with lazy %-formatting rather than the root-logger
+        # convenience functions.
+        self._log = logging.getLogger('observability')
         self._setup_logging(log_level)
         
-        # Initialize metrics storage
+        # Wall-clock anchor + monotonic origin: hot paths record only a
+        # cheap monotonic delta and the ISO string is materialized lazily
+        # at save/print time
+        self._t0_wall = datetime.now()
+        self._t0_mono = time.monotonic()
+        
+        # Initialize metrics storage. Events live in a bounded ring buffer;
+        # the per-type Counter keeps exact totals even after old bodies of
+        # high-volume sessions have been rotated out.
         self.metrics = {
             'agent_calls': {},
             'agent_timings': {},
-            'errors': [],
-            'events': [],
-            'session_start': datetime.now().isoformat(),
+            # Bounded: only the most recent errors keep their bodies;
+            # the exact total lives in _total_errors
+            'errors': deque(maxlen=self.RECENT_ERRORS_SAVED),
+            'session_start': self._t0_wall.isoformat(),
             'session_id': self._generate_session_id()
         }
+        self._total_errors = 0
+
+        # Columnar (struct-of-arrays) event storage: one bounded column
+        # per field instead of a deque of per-event dicts. Scans that
+        # only need one field (e.g. types, timestamps) touch just that
+        # column, and we skip a ~230-byte dict per event.
+        self._events = {
+            'type': deque(maxlen=self.MAX_EVENTS_KEPT),
+            'message': deque(maxlen=self.MAX_EVENTS_KEPT),
+            'data': deque(maxlen=self.MAX_EVENTS_KEPT),
+            't': deque(maxlen=self.MAX_EVENTS_KEPT),
+        }
+        self._event_type_counts: Counter = Counter()
+        self._total_events = 0
+        
+        # Per-type rate meters ([bucket_start, count] over 1s buckets):
+        # once a type bursts past SAMPLE_RATE_THRESHOLD/sec, only
+        # 1-in-SAMPLE_KEEP_1_IN bodies are stored. Counts stay exact.
+        self._rate_meters: Dict[str, list] = {}
+        
+        # Agent names kept pre-sorted (insertion via bisect on first
+        # sight), so print_summary iterates in order without re-sorting
+        self._sorted_agents: List[str] = []
+        
+        # Memoization: every mutator bumps _version; summary and event-
+        # type snapshots are cached against the version they were built
+        # from, so repeated reads between mutations are O(1)
+        self._version = 0
+        self._summary_cache: tuple = (None, -1)
+        self._event_types_cache: tuple = (None, -1)
         
-        # Thread safety
+        # Thread safety: one coarse lock for cross-cutting state (events,
+        # summary cache), plus one lock per agent so concurrent agents
+        # recording timings never contend with each other
         self._lock = Lock()
+        self._agent_locks: defaultdict = defaultdict(Lock)
         
-        logging.info("="*80)
-        logging.info("ObservabilityLogger initialized")
-        logging.info(f"Session ID: {self.metrics['session_id']}")
-        logging.info(f"Log file: {self.log_file}")
-        logging.info(f"Metrics file: {self.metrics_file}")
-        logging.info("="*80)
+        # History-size cache: counted from disk once on the first flush,
+        # then maintained incrementally so the append path never re-reads
+        # the history file just to decide whether to compact
+        self._history_lines: Optional[int] = None
+        
+        # Deferred metrics persistence: save_metrics only marks the state
+        # dirty; this daemon thread coalesces bursts of saves into at most
+        # one disk write per FLUSH_DEBOUNCE window. A final flush runs at
+        # interpreter exit so nothing is lost on shutdown.
+        self._dirty = Event()
+        self._flush_stop = Event()
+        self._flush_thread = Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self._flush_now)
+        
+        self._log.info("=" * 80)
+        self._log.info("ObservabilityLogger initialized")
+        self._log.info("Session ID: %s", self.metrics['session_id'])
+        self._log.info("Log file: %s", self.log_file)
+        self._log.info("Metrics file: %s", self.metrics_file)
+        self._log.info("=" * 80)
     
+    def _iso(self, t: float) -> str:
+        """
+        Materialize an ISO timestamp from a stored monotonic delta.
+
+        Args:
+            t (float): Seconds since the session's monotonic origin
+
+        Returns:
+            str: ISO-formatted wall-clock timestamp
+        """
+        return (self._t0_wall + timedelta(seconds=t)).isoformat()
+
     def _generate_session_id(self) -> str:
         """
         Generate unique session identifier.
@@ -169,31 +291,41 @@ class ObservabilityLogger:
             - Console logging: Simplified format
             - Auto-creates log directory
             - Append mode for files
+            - Idempotent: handlers are installed once per process on the
+              'observability' logger, never on the root logger
         """
+        global _LOGGING_CONFIGURED
+        
         # Ensure logs directory exists
         os.makedirs(self.log_file.parent, exist_ok=True)
         
         # Convert log level string to logging constant
-        numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-        
-        # Clear existing handlers to avoid duplicates
-        logging.getLogger('').handlers.clear()
+        numeric_level = _LEVELS.get(log_level.upper(), logging.INFO)
+        self._log.setLevel(numeric_level)
         
-        # Configure root logger
-        logging.basicConfig(
-            level=numeric_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # Configure handlers once per process. Re-instantiating the
+        # logger must not rewire global logging state or double-install
+        # handlers (each duplicate costs formatting + I/O per record).
+        if _LOGGING_CONFIGURED:
+            return
+        _LOGGING_CONFIGURED = True
         
-        # File handler with detailed format
-        file_handler = logging.FileHandler(str(self.log_file), mode='a', encoding='utf-8')
+        # File handler with detailed format, reused across reconfigures
+        # so resets never reopen (or leak) the log file descriptor
+        file_handler = _HANDLER_CACHE.get(self.log_file)
+        if file_handler is None:
+            # delay=True: the descriptor opens on first emitted record,
+            # not at configuration time
+            file_handler = logging.FileHandler(
+                str(self.log_file), mode='a', encoding='utf-8', delay=True
+            )
+            file_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            file_handler.setFormatter(file_formatter)
+            _HANDLER_CACHE[self.log_file] = file_handler
         file_handler.setLevel(numeric_level)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
         
         # Console handler with simplified format
         console_handler = logging.StreamHandler()
@@ -201,12 +333,42 @@ class ObservabilityLogger:
         console_formatter = logging.Formatter('%(levelname)s - %(message)s')
         console_handler.setFormatter(console_formatter)
         
-        # Add handlers to root logger
-        root_logger = logging.getLogger('')
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(console_handler)
+        # Producers only enqueue records (a fast, lock-light put); the
+        # QueueListener's daemon thread does all formatting and file/console
+        # I/O off the hot path
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler,
+            respect_handler_level=True
+        )
+        self._log_listener.daemon = True
+        self._log_listener.start()
+        # Drain any queued records before interpreter teardown
+        atexit.register(self._stop_listener)
+        
+        # Attach to the named logger only; records do not propagate to
+        # root, so other libraries' logging config stays untouched
+        self._log.addHandler(queue_handler)
+        self._log.propagate = False
+        
+        # Keep references so _teardown_logging can detach and close
+        self._queue_handler = queue_handler
+        self._file_handler = file_handler
+        self._console_handler = console_handler
+    
+    def _stop_listener(self) -> None:
+        """
+        Stop the queue listener if it is still running.
+        
+        Safe to call more than once: teardown and the atexit hook may
+        both reach here.
+        """
+        if self._log_listener._thread is not None:
+            self._log_listener.stop()
     
-    def start_timer(self, agent_name: str) -> float:
+    def start_timer(self, agent_name: str) -> int:
         """
         Start timing an agent operation.
         
@@ -214,20 +376,24 @@ class ObservabilityLogger:
             agent_name (str): Name of agent being timed
         
         Returns:
-            float: Start timestamp for use with end_timer()
+            int: Opaque start token for use with end_timer()
+        
+        Note:
+            The token is a monotonic perf_counter_ns reading, immune to
+            NTP/wall-clock jumps and cheaper to take than time.time().
         
         Example:
             >>> start = logger.start_timer("ResearchAgent")
             >>> # ... do research ...
             >>> logger.end_timer("ResearchAgent", start)
         """
-        logging.info(f"▶️  Starting {agent_name}")
-        return time.time()
+        self._log.info(self._START_FMT, agent_name)
+        return time.perf_counter_ns()
     
     def end_timer(
         self,
         agent_name: str,
-        start_time: float,
+        start_time: int,
         success: bool = True,
         error: Optional[Exception] = None
     ) -> float:
@@ -236,7 +402,7 @@ class ObservabilityLogger:
         
         Args:
             agent_name (str): Name of agent being timed
-            start_time (float): Start timestamp from start_timer()
+            start_time (int): Opaque start token from start_timer()
             success (bool): Whether operation succeeded
             error (Exception, optional): Error if operation failed
         
@@ -256,37 +422,78 @@ class ObservabilityLogger:
             ... except Exception as e:
             ...     logger.end_timer("FactCheckerAgent", start, success=False, error=e)
         """
-        elapsed = time.time() - start_time
+        # Integer nanosecond delta on a monotonic clock: no float
+        # rounding in the accumulators, no negative elapsed on clock skew
+        elapsed_ns = time.perf_counter_ns() - start_time
+        elapsed = elapsed_ns / 1e9
         
-        with self._lock:
-            # Log completion
-            if success:
-                logging.info(f"✅ {agent_name} completed in {elapsed:.2f}s")
-            else:
-                logging.error(f"❌ {agent_name} failed in {elapsed:.2f}s: {error}")
-            
-            # Initialize metrics for agent if needed
-            if agent_name not in self.metrics['agent_calls']:
-                self.metrics['agent_calls'][agent_name] = {'success': 0, 'failure': 0}
-                self.metrics['agent_timings'][agent_name] = []
-            
-            # Update call counts
-            if success:
-                self.metrics['agent_calls'][agent_name]['success'] += 1
+        # Log completion outside the lock — the record is only enqueued
+        # here, and only if the level is actually enabled
+        if success:
+            self._log.info(self._DONE_FMT, agent_name, elapsed)
+        elif self._log.isEnabledFor(logging.ERROR):
+            self._log.error(self._FAIL_FMT, agent_name, elapsed, error)
+        
+        # Initialize metrics for agent if needed — only this rare first-seen
+        # branch takes a lock, and only this agent's shard. Each agent gets
+        # its own dicts so concurrent agents never mutate the same entry.
+        calls = self.metrics['agent_calls'].get(agent_name)
+        if calls is None:
+            with self._agent_locks[agent_name]:
+                calls = self.metrics['agent_calls'].setdefault(
+                    agent_name, {'success': 0, 'failure': 0}
+                )
+                if agent_name not in self.metrics['agent_timings']:
+                    self.metrics['agent_timings'][agent_name] = {
+                        'n': 0, 'sum': 0.0, 'mean': 0.0, 'm2': 0.0,
+                        'min': float('inf'), 'max': float('-inf'),
+                        'ema': 0.0
+                    }
+                    bisect.insort(self._sorted_agents, agent_name)
+
+        # Counter bumps and list appends are single bytecode-level dict/list
+        # ops — atomic under the GIL, so no lock needed on the hot path
+        if success:
+            calls['success'] += 1
+        else:
+            calls['failure'] += 1
+
+            # Record error ('t' is a monotonic delta, formatted on
+            # demand). The deque keeps only recent bodies; the counter
+            # keeps the total exact.
+            self._total_errors += 1
+            self.metrics['errors'].append({
+                'agent': agent_name,
+                'error': str(error),
+                'error_type': type(error).__name__ if error else 'Unknown',
+                't': time.monotonic() - self._t0_mono,
+                'elapsed_ns': elapsed_ns
+            })
+
+        # Record timing via streaming (Welford) accumulators: O(1) memory per
+        # agent regardless of call count. Multi-field update, so briefly
+        # locked — but only on this agent's shard, so two agents finishing
+        # at once update in parallel instead of serializing on one lock.
+        # Accumulators hold nanosecond ints (sum/min/max stay exact);
+        # conversion to seconds happens once at summary/print time
+        stats = self.metrics['agent_timings'][agent_name]
+        with self._agent_locks[agent_name]:
+            stats['n'] += 1
+            stats['sum'] += elapsed_ns
+            if elapsed_ns < stats['min']:
+                stats['min'] = elapsed_ns
+            if elapsed_ns > stats['max']:
+                stats['max'] = elapsed_ns
+            delta = elapsed_ns - stats['mean']
+            stats['mean'] += delta / stats['n']
+            stats['m2'] += delta * (elapsed_ns - stats['mean'])
+            # Exponential moving average tracks recent latency drift that
+            # the lifetime mean smooths away
+            if stats['n'] == 1:
+                stats['ema'] = float(elapsed_ns)
             else:
-                self.metrics['agent_calls'][agent_name]['failure'] += 1
-                
-                # Record error
-                self.metrics['errors'].append({
-                    'agent': agent_name,
-                    'error': str(error),
-                    'error_type': type(error).__name__ if error else 'Unknown',
-                    'timestamp': datetime.now().isoformat(),
-                    'elapsed': elapsed
-                })
-            
-            # Record timing
-            self.metrics['agent_timings'][agent_name].append(elapsed)
+                stats['ema'] += self.EMA_ALPHA * (elapsed_ns - stats['ema'])
+            self._version += 1
         
         return elapsed
     
@@ -310,34 +517,52 @@ class ObservabilityLogger:
             >>> logger.log_event("SESSION", "User preferences updated",
             ...                  {"length": "detailed", "format": "paragraph"})
         """
+        # Enqueue the log record outside the lock with lazy %-formatting:
+        # the data payload is only stringified if a handler actually
+        # emits the record, so filtered-out events cost nothing
+        if data:
+            self._log.info('[%s] %s | %s', event_type, message, data)
+        else:
+            self._log.info('[%s] %s', event_type, message)
+        
         with self._lock:
-            # Create log message
-            log_msg = f"[{event_type}] {message}"
-            if data:
-                log_msg += f" | {json.dumps(data)}"
+            now_t = time.monotonic() - self._t0_mono
+            self._event_type_counts[event_type] += 1
+            self._total_events += 1
+            self._version += 1
             
-            logging.info(log_msg)
+            # Adaptive downsampling: estimate this type's rate over 1s
+            # buckets; past the threshold, keep only every K-th body.
+            # The Counter above stays exact either way.
+            meter = self._rate_meters.get(event_type)
+            if meter is None or now_t - meter[0] >= 1.0:
+                self._rate_meters[event_type] = meter = [now_t, 0]
+            meter[1] += 1
+            if (meter[1] > self.SAMPLE_RATE_THRESHOLD
+                    and self._event_type_counts[event_type] % self.SAMPLE_KEEP_1_IN):
+                return
             
-            # Store event in metrics
-            self.metrics['events'].append({
-                'type': event_type,
-                'message': message,
-                'data': data,
-                'timestamp': datetime.now().isoformat()
-            })
+            # One append per column ('t' is a monotonic delta). The
+            # bounded columns drop the oldest event in lockstep once
+            # full; counts stay exact above.
+            self._events['type'].append(event_type)
+            self._events['message'].append(message)
+            # Shallow snapshot: callers often reuse/mutate their data
+            # dict after logging, which would silently corrupt metrics
+            self._events['data'].append(data.copy() if data else None)
+            self._events['t'].append(now_t)
     
     def save_metrics(self) -> bool:
         """
-        Save metrics to JSON file with historical tracking.
+        Schedule a metrics flush to the JSON file.
         
-        Returns:
-            bool: True if save successful, False otherwise
+        The actual write happens on a background thread, debounced so
+        that bursts of save_metrics calls collapse into a single disk
+        write per FLUSH_DEBOUNCE window. A final flush also runs at
+        interpreter exit, so callers never lose the last session.
         
-        Features:
-            - Calculates summary statistics
-            - Appends to historical data
-            - Maintains retention limit
-            - Pretty-prints JSON
+        Returns:
+            bool: True (the flush was scheduled)
         
         File Structure:
             List of session metrics, each with:
@@ -350,33 +575,64 @@ class ObservabilityLogger:
             >>> logger.save_metrics()
             True
         """
+        self._dirty.set()
+        return True
+    
+    def _flush_loop(self) -> None:
+        """
+        Background flush thread: wait for dirty state, debounce, write.
+        """
+        while not self._flush_stop.is_set():
+            if not self._dirty.wait(timeout=1.0):
+                continue
+            # Coalesce: let further saves pile up before the single write
+            if self._flush_stop.wait(timeout=self.FLUSH_DEBOUNCE):
+                break
+            self._flush_now()
+    
+    def _flush_now(self) -> bool:
+        """
+        Write the current metrics summary to disk immediately.
+        
+        Uses a temp-file + os.replace so a crash mid-write can never
+        leave a truncated metrics file behind.
+        
+        Returns:
+            bool: True if save successful, False otherwise
+        """
+        if not self._dirty.is_set():
+            return True
+        self._dirty.clear()
+        
         with self._lock:
             try:
                 # Calculate session summary
                 metrics_summary = self._calculate_summary()
                 
-                # Load existing metrics history
-                metrics_history = self._load_metrics_history()
+                # Count existing history lines once; afterwards the
+                # in-memory counter tracks the file without re-reads
+                if self._history_lines is None:
+                    self._history_lines = self._count_history_lines()
                 
-                # Append current session
-                metrics_history.append(metrics_summary)
+                # Append one NDJSON line: O(1 session) I/O regardless of
+                # how much history the file already holds
+                with open(self.metrics_file, 'ab') as f:
+                    f.write(_json_dumps(metrics_summary) + b'\n')
+                self._history_lines += 1
                 
-                # Maintain retention limit
-                metrics_history = metrics_history[-self.METRICS_RETENTION:]
+                # Compact lazily once the file grows past twice the
+                # retention limit, rewriting only the lines we keep
+                self._maybe_compact_history()
                 
-                # Save to file
-                with open(self.metrics_file, 'w', encoding='utf-8') as f:
-                    json.dump(metrics_history, f, indent=2, ensure_ascii=False)
-                
-                logging.info(f"✅ Metrics saved to {self.metrics_file}")
+                self._log.info("✅ Metrics saved to %s", self.metrics_file)
                 return True
                 
             except OSError as e:
-                logging.error(f"❌ Failed to save metrics (file system): {e}")
+                self._log.error("❌ Failed to save metrics (file system): %s", e)
                 return False
                 
             except Exception as e:
-                logging.error(f"❌ Failed to save metrics: {type(e).__name__}: {e}")
+                self._log.error("❌ Failed to save metrics: %s: %s", type(e).__name__, e)
                 return False
     
     def _calculate_summary(self) -> Dict[str, Any]:
@@ -386,35 +642,56 @@ class ObservabilityLogger:
         Returns:
             Dict[str, Any]: Summary statistics
         """
+        # Serve the memoized summary when nothing has mutated since it
+        # was built; only the two time-derived fields need refreshing
+        cached, version = self._summary_cache
+        if version == self._version:
+            cached['session_end'] = datetime.now().isoformat()
+            cached['session_duration_seconds'] = time.monotonic() - self._t0_mono
+            return cached
+        
         summary = {
             'session_id': self.metrics['session_id'],
             'session_start': self.metrics['session_start'],
             'session_end': datetime.now().isoformat(),
             'agent_calls': self.metrics['agent_calls'].copy(),
             'agent_timings_avg': {},
-            'total_errors': len(self.metrics['errors']),
-            'errors': self.metrics['errors'][-self.RECENT_ERRORS_SAVED:],
-            'total_events': len(self.metrics['events']),
+            'total_errors': self._total_errors,
+            'errors': [
+                {
+                    'agent': err['agent'],
+                    'error': err['error'],
+                    'error_type': err['error_type'],
+                    'timestamp': self._iso(err['t']),
+                    'elapsed': err['elapsed_ns'] / 1e9
+                }
+                # Snapshot first: list(deque) is a single C-level copy,
+                # so a failure appended concurrently (end_timer writes
+                # outside this lock) can't raise "deque mutated during
+                # iteration" mid-comprehension
+                for err in list(self.metrics['errors'])
+            ],
+            'total_events': self._total_events,
             'event_types': self._count_event_types()
         }
         
-        # Calculate timing statistics
-        for agent, timings in self.metrics['agent_timings'].items():
-            if timings:
+        # Read timing statistics straight from the streaming accumulators,
+        # converting nanoseconds to seconds only here
+        for agent, stats in self.metrics['agent_timings'].items():
+            if stats['n']:
                 summary['agent_timings_avg'][agent] = {
-                    'avg': sum(timings) / len(timings),
-                    'min': min(timings),
-                    'max': max(timings),
-                    'total': sum(timings),
-                    'count': len(timings)
+                    'avg': stats['mean'] / 1e9,
+                    'ema': stats['ema'] / 1e9,
+                    'min': stats['min'] / 1e9,
+                    'max': stats['max'] / 1e9,
+                    'total': stats['sum'] / 1e9,
+                    'count': stats['n']
                 }
         
-        # Calculate session duration
-        start = datetime.fromisoformat(self.metrics['session_start'])
-        end = datetime.now()
-        duration = (end - start).total_seconds()
-        summary['session_duration_seconds'] = duration
+        # Calculate session duration from the monotonic origin
+        summary['session_duration_seconds'] = time.monotonic() - self._t0_mono
         
+        self._summary_cache = (summary, self._version)
         return summary
     
     def _count_event_types(self) -> Dict[str, int]:
@@ -424,39 +701,60 @@ class ObservabilityLogger:
         Returns:
             Dict[str, int]: Event type counts
         """
-        counts = {}
-        for event in self.metrics['events']:
-            event_type = event['type']
-            counts[event_type] = counts.get(event_type, 0) + 1
+        cached, version = self._event_types_cache
+        if version == self._version:
+            return cached
+        
+        counts = dict(self._event_type_counts)
+        self._event_types_cache = (counts, self._version)
         return counts
     
-    def _load_metrics_history(self) -> List[Dict[str, Any]]:
+    def _count_history_lines(self) -> int:
         """
-        Load existing metrics history from file.
+        Count the NDJSON history lines currently on disk.
+        
+        Runs once per process (the counter is maintained incrementally
+        afterwards), so the per-save cost of sizing the file is paid a
+        single time.
         
         Returns:
-            List[Dict[str, Any]]: Historical metrics or empty list
+            int: Number of history lines, 0 if the file is missing
         """
         if not self.metrics_file.exists():
-            return []
+            return 0
+        
+        try:
+            with open(self.metrics_file, 'rb') as f:
+                return sum(1 for line in f if line.strip())
+        except OSError:
+            return 0
+    
+    def _maybe_compact_history(self) -> None:
+        """
+        Compact the NDJSON history once it exceeds twice the retention.
+        
+        The decision uses the in-memory line counter — no disk read on
+        the common path. When triggered, rewrites the newest
+        METRICS_RETENTION lines to a sibling temp file and swaps it in
+        with os.replace, so the append path stays O(1) and the file
+        never grows without bound.
+        """
+        if self._history_lines is None or \
+                self._history_lines <= 2 * self.METRICS_RETENTION:
+            return
         
         try:
             with open(self.metrics_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-                
-                # Ensure list format
-                if not isinstance(history, list):
-                    history = [history]
-                
-                return history
-                
-        except json.JSONDecodeError:
-            logging.warning("⚠️  Corrupted metrics file, starting fresh")
-            return []
+                lines = f.readlines()
+            
+            tmp_path = str(self.metrics_file) + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines[-self.METRICS_RETENTION:])
+            os.replace(tmp_path, self.metrics_file)
+            self._history_lines = min(self._history_lines, self.METRICS_RETENTION)
             
-        except Exception as e:
-            logging.error(f"⚠️  Error loading metrics history: {e}")
-            return []
+        except OSError as e:
+            self._log.warning("⚠️  Metrics compaction skipped: %s", e)
     
     def print_summary(self) -> None:
         """
@@ -480,14 +778,14 @@ class ObservabilityLogger:
             
             # Session info
             print(f"\n🔍 Session: {self.metrics['session_id']}")
-            start = datetime.fromisoformat(self.metrics['session_start'])
-            duration = (datetime.now() - start).total_seconds()
+            duration = time.monotonic() - self._t0_mono
             print(f"⏱️  Duration: {duration:.1f}s ({duration/60:.1f}m)")
             
             # Agent calls
             if self.metrics['agent_calls']:
                 print("\n🔧 Agent Calls:")
-                for agent, counts in sorted(self.metrics['agent_calls'].items()):
+                for agent in self._sorted_agents:
+                    counts = self.metrics['agent_calls'][agent]
                     total = counts['success'] + counts['failure']
                     success_rate = (counts['success'] / total * 100) if total > 0 else 0
                     status_icon = "✅" if success_rate == 100 else "⚠️" if success_rate >= 50 else "❌"
@@ -498,29 +796,27 @@ class ObservabilityLogger:
             # Agent timings
             if self.metrics['agent_timings']:
                 print("\n⏱️  Agent Performance:")
-                for agent, timings in sorted(self.metrics['agent_timings'].items()):
-                    if timings:
-                        avg = sum(timings) / len(timings)
-                        min_time = min(timings)
-                        max_time = max(timings)
+                for agent in self._sorted_agents:
+                    stats = self.metrics['agent_timings'][agent]
+                    if stats['n']:
                         print(f"  • {agent}:")
-                        print(f"     Avg: {avg:.2f}s | Min: {min_time:.2f}s | Max: {max_time:.2f}s")
+                        print(f"     Avg: {stats['mean']/1e9:.2f}s | Min: {stats['min']/1e9:.2f}s | Max: {stats['max']/1e9:.2f}s")
             
             # Errors
-            if self.metrics['errors']:
-                print(f"\n❌ Errors: {len(self.metrics['errors'])} total")
-                recent_errors = self.metrics['errors'][-3:]  # Last 3
+            if self._total_errors:
+                print(f"\n❌ Errors: {self._total_errors} total")
+                recent_errors = list(self.metrics['errors'])[-3:]  # Last 3
                 for i, error in enumerate(recent_errors, 1):
                     print(f"  {i}. [{error['error_type']}] {error['agent']}")
                     print(f"     {error['error'][:70]}...")
-                    print(f"     Time: {error['timestamp']}")
+                    print(f"     Time: {self._iso(error['t'])}")
             else:
                 print("\n✅ No errors recorded")
             
             # Events
-            if self.metrics['events']:
+            if self._total_events:
                 event_counts = self._count_event_types()
-                print(f"\n📝 Events: {len(self.metrics['events'])} total")
+                print(f"\n📝 Events: {self._total_events} total")
                 for event_type, count in sorted(event_counts.items()):
                     print(f"  • {event_type}: {count}")
             
@@ -556,8 +852,8 @@ class ObservabilityLogger:
                 'successful_calls': total_success,
                 'failed_calls': total_failure,
                 'overall_success_rate': success_rate,
-                'total_errors': len(self.metrics['errors']),
-                'total_events': len(self.metrics['events']),
+                'total_errors': self._total_errors,
+                'total_events': self._total_events,
                 'agents_used': list(self.metrics['agent_calls'].keys())
             }
     
@@ -569,20 +865,89 @@ class ObservabilityLogger:
         Previous metrics should be saved before resetting.
         """
         with self._lock:
+            self._t0_wall = datetime.now()
+            self._t0_mono = time.monotonic()
             self.metrics = {
                 'agent_calls': {},
                 'agent_timings': {},
-                'errors': [],
-                'events': [],
-                'session_start': datetime.now().isoformat(),
+                'errors': deque(maxlen=self.RECENT_ERRORS_SAVED),
+                'session_start': self._t0_wall.isoformat(),
                 'session_id': self._generate_session_id()
             }
-            logging.info(f"✅ Metrics reset for new session: {self.metrics['session_id']}")
+            self._total_errors = 0
+            self._sorted_agents = []
+            for column in self._events.values():
+                column.clear()
+            self._event_type_counts = Counter()
+            self._rate_meters = {}
+            self._version += 1
+            self._summary_cache = (None, -1)
+            self._event_types_cache = (None, -1)
+            self._total_events = 0
+            self._log.info("✅ Metrics reset for new session: %s", self.metrics['session_id'])
+
+
+# Module-level guard: logging handlers are installed at most once per
+# process, no matter how many logger instances are created
+_LOGGING_CONFIGURED = False
+
+
+def _teardown_logging(instance: ObservabilityLogger) -> None:
+    """
+    Detach and close the handlers installed by an ObservabilityLogger.
+    
+    Only the instance that actually configured logging holds handler
+    references; for any other instance this is a no-op.
+    
+    Args:
+        instance (ObservabilityLogger): Logger whose handlers to remove
+    """
+    global _LOGGING_CONFIGURED
+    
+    # Every instance owns a flush thread and an atexit hook regardless
+    # of whether it configured logging — stop both so an abandoned
+    # instance doesn't keep waking once per second or re-flush at exit.
+    # Setting _dirty after _flush_stop makes the loop's waits return
+    # immediately, so the join is prompt; snapshot the dirty state
+    # first so the wake-up poke isn't mistaken for pending data.
+    was_dirty = instance._dirty.is_set()
+    instance._flush_stop.set()
+    instance._dirty.set()
+    instance._flush_thread.join(timeout=5.0)
+    atexit.unregister(instance._flush_now)
+    if was_dirty:
+        # One final write so state marked dirty before teardown lands
+        instance._flush_now()
+    
+    queue_handler = getattr(instance, '_queue_handler', None)
+    if queue_handler is None:
+        return
+    
+    instance._stop_listener()
+    instance._log.removeHandler(queue_handler)
+    # The file handler stays open in _HANDLER_CACHE for the next
+    # configuration; closing it here would churn (or leak) FDs across
+    # repeated resets
+    instance._console_handler.close()
+    _LOGGING_CONFIGURED = False
+
 
+# Global logger singleton: functools.cache gives thread-safe lazy
+# initialization (the GIL serializes the cache fill), so get_logger is
+# a plain dict lookup with no user-space lock traffic
 
-# Global logger singleton
-_global_logger: Optional[ObservabilityLogger] = None
-_global_lock = Lock()
+
+@functools.cache
+def _make_logger() -> ObservabilityLogger:
+    """
+    Create the process-wide ObservabilityLogger (cached after first call).
+    
+    Returns:
+        ObservabilityLogger: Global logger instance
+    """
+    logger = ObservabilityLogger()
+    logging.getLogger('observability').info("✅ Global observability logger created")
+    return logger
 
 
 def get_logger() -> ObservabilityLogger:
@@ -593,8 +958,9 @@ def get_logger() -> ObservabilityLogger:
         ObservabilityLogger: Global logger instance
     
     Thread Safety:
-        Thread-safe initialization using Lock. Multiple threads
-        calling this simultaneously will safely get the same instance.
+        Safe without an explicit lock: functools.cache resolves the
+        singleton atomically under the GIL, so concurrent first calls
+        still observe one shared instance.
     
     Example:
         >>> logger = get_logger()
@@ -602,14 +968,7 @@ def get_logger() -> ObservabilityLogger:
         >>> # ... work ...
         >>> logger.end_timer("MyAgent", start)
     """
-    global _global_logger
-    
-    with _global_lock:
-        if _global_logger is None:
-            _global_logger = ObservabilityLogger()
-            logging.info("✅ Global observability logger created")
-        
-        return _global_logger
+    return _make_logger()
 
 
 def reset_global_logger() -> None:
@@ -625,11 +984,10 @@ def reset_global_logger() -> None:
         >>> logger2 = get_logger()
         >>> assert logger1 is not logger2
     """
-    global _global_logger
-    
-    with _global_lock:
-        _global_logger = None
-        logging.info("✅ Global observability logger reset")
+    logging.getLogger('observability').info("✅ Global observability logger reset")
+    if _make_logger.cache_info().currsize:
+        _teardown_logging(_make_logger())
+    _make_logger.cache_clear()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,71 @@
+"""
+GoogleSearchTool Demo Script
+
+Manual demo for google_search_tool.py, kept in its own module so the
+multi-query test body is only compiled when someone actually runs the
+demo — importing the tool no longer pays for this code.
+
+Run it via:
+    python src/tools/google_search_tool.py
+or directly:
+    python src/tools/_demo_google_search.py
+
+Author: Google Hackathon Team
+License: MIT
+"""
+
+
+def main():
+    """
+    Exercise GoogleSearchTool end to end: several queries, result
+    printing, and the statistics report.
+    """
+    from google_search_tool import GoogleSearchTool
+
+    print("GoogleSearchTool Demo")
+    print("=" * 60)
+
+    try:
+        # Initialize tool
+        tool = GoogleSearchTool()
+
+        # Test queries
+        test_queries = [
+            ("artificial intelligence", 3),
+            ("quantum computing applications", 5),
+            ("climate change solutions", 4)
+        ]
+
+        for query, num_results in test_queries:
+            print(f"\n{'='*60}")
+            print(f"TEST QUERY: '{query}' ({num_results} results)")
+            print(f"{'='*60}")
+
+            results = tool.search(query, num_results)
+
+            print(f"\n📊 RESULTS ({len(results)}):")
+            for i, result in enumerate(results, 1):
+                print(f"\n{i}. {result['title']}")
+                print(f"   URL: {result['url']}")
+                print(f"   Snippet: {result['snippet'][:100]}...")
+
+        # Test statistics
+        print(f"\n\n{'='*60}")
+        print("📈 TOOL STATISTICS")
+        print(f"{'='*60}")
+        stats = tool.get_statistics()
+        for key, value in stats.items():
+            print(f"  {key}: {value}")
+
+        print("\n✓ All tests passed!")
+        print("\n⚠️ REMINDER: These are simulated results for demo purposes")
+        print("⚠️ For production, integrate real search API")
+
+    except Exception as e:
+        print(f"\n❌ Demo failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,14 @@ Author: Google Hackathon Team
 License: MIT
 """
 
+import asyncio
+import hashlib
 import json
+import logging
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -24,6 +29,58 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.rate_limiter import get_rate_limiter, retry_on_rate_limit
 
+# Prefer orjson when available: a C extension several times faster at
+# parsing than the stdlib json module, with identical output for the
+# plain dict/list payloads Gemini returns
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Strip markdown code fences in one compiled pass instead of two full
+# str.replace scans over the response text
+_CODEFENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$', re.MULTILINE)
+
+# Module logger: %-style lazy formatting means a filtered-out record
+# costs one level check instead of an f-string build plus stdout flush
+logger = logging.getLogger(__name__)
+
+# Whitespace collapser for title normalization during dedup
+_WS_RE = re.compile(r'\s+')
+
+
+def _collect_stream(response, open_ch: str, close_ch: str) -> str:
+    """
+    Accumulate a streamed Gemini response, stopping early once the JSON
+    payload is structurally complete.
+
+    Tracks bracket balance incrementally per chunk — once at least one
+    closer has arrived and the depth returns to zero, the payload is
+    closed and whatever the model still wants to stream (trailing
+    newlines, closing code fences, commentary) is decoration we can
+    skip. A miscount from brackets inside string values just means no
+    early exit; correctness is unaffected.
+
+    Args:
+        response: Streaming iterator from generate_content(stream=True)
+        open_ch (str): Opening bracket of the expected payload
+        close_ch (str): Matching closing bracket
+
+    Returns:
+        str: Concatenated response text received so far
+    """
+    chunks = []
+    opens = closes = 0
+    for chunk in response:
+        text = chunk.text
+        chunks.append(text)
+        opens += text.count(open_ch)
+        closes += text.count(close_ch)
+        if closes and closes >= opens:
+            break
+    return ''.join(chunks)
+
 
 class GoogleSearchTool:
     """
@@ -134,7 +191,56 @@ class GoogleSearchTool:
     DEFAULT_NUM_RESULTS = 3
     MAX_RESULTS = 10
     SNIPPET_LENGTH = 150  # Target character length for snippets
+
+    # On-disk result cache: a hit returns instantly with zero API cost
+    CACHE_DIR = Path('.gemini_search_cache')
+    CACHE_MODES = ('enabled', 'read-only', 'write-only', 'replay', 'off')
+
+    # Keys every result must carry; issubset runs the membership loop
+    # at C level instead of a Python-level all() generator
+    _REQUIRED_KEYS = frozenset({'title', 'snippet', 'url'})
+
+    # Tuple form lets str.startswith test both schemes in one C call
+    _VALID_URL_SCHEMES = ('http://', 'https://')
     
+    # Static skeletons for padding and fallback results, built once at
+    # class definition instead of re-allocating every f-string (and
+    # re-slugging the query) on each call down the failure path
+    _PADDING_TITLES = (
+        "Introduction to {q}",
+        "Understanding {q}: A Comprehensive Guide",
+        "Latest Research on {q}",
+        "Practical Applications of {q}",
+        "{q}: Key Concepts and Trends",
+    )
+    _PADDING_SNIPPET = (
+        "Comprehensive information about {q} and related topics. "
+        "This resource provides detailed insights and practical guidance."
+    )
+    _FALLBACK_TEMPLATES = (
+        ("Comprehensive Guide to {q}",
+         "An in-depth exploration of {q}, covering fundamental concepts and "
+         "recent developments. This resource provides valuable insights for "
+         "researchers and practitioners.",
+         "https://example.com/guide-{slug}"),
+        ("Research Insights: {q}",
+         "Current research findings and analysis related to {q}. Includes "
+         "expert perspectives and evidence-based recommendations.",
+         "https://example.com/research-{slug}"),
+        ("Understanding {q}: Key Concepts",
+         "Essential information about {q} for beginners and experts alike. "
+         "Covers fundamental principles and practical applications.",
+         "https://example.com/understanding-{slug}"),
+        ("Latest Trends in {q}",
+         "Emerging trends and developments in the field of {q}. Stay updated "
+         "with cutting-edge research and innovations.",
+         "https://example.com/trends-{slug}"),
+        ("Practical Applications of {q}",
+         "Real-world applications and use cases for {q}. Learn how "
+         "professionals are leveraging these concepts in practice.",
+         "https://example.com/applications-{slug}"),
+    )
+
     # Realistic domains for URL generation
     REALISTIC_DOMAINS = [
         'medium.com', 'towardsdatascience.com', 'arxiv.org',
@@ -142,6 +248,54 @@ class GoogleSearchTool:
         'mit.edu', 'stanford.edu', 'nature.com',
         'github.com', 'stackoverflow.com', 'wikipedia.org'
     ]
+
+    # Prompt skeleton assembled once at class definition: per-call work
+    # is a single str.format, with no join or multi-line f-string build
+    _DOMAIN_LIST = ', '.join(REALISTIC_DOMAINS[:5])
+    _PROMPT_TEMPLATE = """You are a search engine result generator. Generate {n} realistic, factual search results for the query: "{query}"
+
+REQUIREMENTS:
+1. Results must be factual and based on real information (2024-2025 timeframe)
+2. Each snippet should be exactly 2 sentences providing key information
+3. Use realistic, authoritative domains like: {domains}
+4. Titles should be clear and descriptive (50-100 chars)
+5. URLs should look realistic with appropriate slugs
+
+OUTPUT FORMAT (JSON only, no markdown):
+[
+  {{
+    "title": "Clear, descriptive title here",
+    "snippet": "First sentence providing key information. Second sentence adding important context.",
+    "url": "https://realistic-domain.com/relevant-slug"
+  }}
+]
+
+Generate {n} high-quality results now:"""
+
+    _BATCH_PROMPT_TEMPLATE = """You are a search engine result generator. For each query below, generate {n} realistic, factual search results.
+
+QUERIES:
+{queries}
+
+REQUIREMENTS:
+1. Results must be factual and based on real information (2024-2025 timeframe)
+2. Each snippet should be exactly 2 sentences providing key information
+3. Use realistic, authoritative domains like: {domains}
+4. Titles should be clear and descriptive (50-100 chars)
+5. URLs should look realistic with appropriate slugs
+
+OUTPUT FORMAT (JSON only, no markdown): one JSON object mapping each query string EXACTLY as written above to its list of results:
+{{
+  "query text here": [
+    {{
+      "title": "Clear, descriptive title here",
+      "snippet": "First sentence providing key information. Second sentence adding important context.",
+      "url": "https://realistic-domain.com/relevant-slug"
+    }}
+  ]
+}}
+
+Generate results for all {count} queries now:"""
     
     def __init__(self):
         """
@@ -165,10 +319,18 @@ class GoogleSearchTool:
         # Configure Gemini API
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(self.MODEL_NAME)
-        
-        print(f"[GoogleSearchTool] ✓ Initialized with model: {self.MODEL_NAME}")
-        print(f"[GoogleSearchTool] ⚠ NOTE: This generates simulated results for demo purposes")
-        print(f"[GoogleSearchTool] ⚠ For production, replace with real search API")
+
+        # Result cache policy comes from the environment so tests can
+        # flip to 'replay' (deterministic, zero API calls) without code
+        # changes. Unknown values fall back to 'enabled'.
+        cache_mode = os.environ.get('GEMINI_SEARCH_CACHE_MODE', 'enabled')
+        self.cache_mode = cache_mode if cache_mode in self.CACHE_MODES else 'enabled'
+        if self.cache_mode in ('enabled', 'write-only'):
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+        logger.info("✓ Initialized with model: %s", self.MODEL_NAME)
+        logger.info("⚠ NOTE: This generates simulated results for demo purposes")
+        logger.info("⚠ For production, replace with real search API")
     
     @retry_on_rate_limit(max_retries=3, backoff_factor=2)
     def search(
@@ -216,83 +378,378 @@ class GoogleSearchTool:
         """
         # Validate and cap num_results
         num_results = max(1, min(num_results, self.MAX_RESULTS))
-        
-        print(f"\n[GoogleSearchTool] {'='*60}")
-        print(f"[GoogleSearchTool] Searching for: '{query}'")
-        print(f"[GoogleSearchTool] Requested results: {num_results}")
-        print(f"[GoogleSearchTool] {'='*60}")
+
+        # Content-addressed cache check: identical (query, model, count)
+        # triples return the stored result with zero API latency or cost
+        cache_key = self._cache_key(query, num_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("✓ Cache hit for '%s'", query)
+            return cached
+
+        if self.cache_mode == 'replay':
+            # Replay mode exists for deterministic testing: a miss means
+            # the recording is incomplete, so fail loudly
+            raise LookupError(
+                f"Replay cache miss for query '{query}' (num_results={num_results})"
+            )
+
+        logger.info("Searching for: '%s' (%d results)", query, num_results)
         
         # Apply rate limiting
         rate_limiter = get_rate_limiter()
         rate_limiter.wait_if_needed()
         
         # Construct prompt for realistic result generation
-        domain_list = ', '.join(self.REALISTIC_DOMAINS[:5])
-        
-        prompt = f"""You are a search engine result generator. Generate {num_results} realistic, factual search results for the query: "{query}"
+        prompt = self._build_prompt(query, num_results)
 
-REQUIREMENTS:
-1. Results must be factual and based on real information (2024-2025 timeframe)
-2. Each snippet should be exactly 2 sentences providing key information
-3. Use realistic, authoritative domains like: {domain_list}
-4. Titles should be clear and descriptive (50-100 chars)
-5. URLs should look realistic with appropriate slugs
+        try:
+            # Generate results using Gemini. Streaming lets us stop
+            # reading as soon as the JSON array closes instead of
+            # waiting out the model's trailing decoration tokens.
+            logger.debug("Calling Gemini API...")
+            response = self.model.generate_content(prompt, stream=True)
+            response_text = _collect_stream(response, '[', ']').strip()
+        except Exception as e:
+            logger.warning("✗ Error: %s: %s", type(e).__name__, e)
+            return self._fallback_results(query, num_results)
 
-OUTPUT FORMAT (JSON only, no markdown):
-[
-  {{
-    "title": "Clear, descriptive title here",
-    "snippet": "First sentence providing key information. Second sentence adding important context.",
-    "url": "https://realistic-domain.com/relevant-slug"
-  }}
-]
+        return self._finish_results(response_text, query, num_results, cache_key)
+
+    async def search_async(
+        self,
+        query: str,
+        num_results: int = DEFAULT_NUM_RESULTS
+    ) -> List[Dict[str, str]]:
+        """
+        Async counterpart to search() for event-loop callers.
+
+        Awaits the official generate_content_async so one event loop can
+        keep many generations in flight; everything else — cache policy,
+        validation, padding, fallbacks — matches search() exactly. The
+        blocking rate-limiter wait runs in a worker thread so it never
+        stalls the loop.
+
+        Args:
+            query (str): Search query string
+            num_results (int): Number of results (default: 3, max: 10)
+
+        Returns:
+            List[Dict[str, str]]: Search results (same structure as search())
+
+        Example:
+            >>> tool = GoogleSearchTool()
+            >>> results = asyncio.run(tool.search_async("edge computing"))
+        """
+        num_results = max(1, min(num_results, self.MAX_RESULTS))
 
-Generate {num_results} high-quality results now:"""
+        cache_key = self._cache_key(query, num_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("✓ Cache hit for '%s'", query)
+            return cached
+
+        if self.cache_mode == 'replay':
+            raise LookupError(
+                f"Replay cache miss for query '{query}' (num_results={num_results})"
+            )
+
+        # The limiter sleeps; keep that off the event loop
+        rate_limiter = get_rate_limiter()
+        await asyncio.to_thread(rate_limiter.wait_if_needed)
+
+        prompt = self._build_prompt(query, num_results)
 
         try:
-            # Generate results using Gemini
-            print(f"[GoogleSearchTool] Calling Gemini API...")
-            response = self.model.generate_content(prompt)
+            logger.debug("Calling Gemini API (async)...")
+            response = await self.model.generate_content_async(prompt)
             response_text = response.text.strip()
-            
+        except Exception as e:
+            logger.warning("✗ Error: %s: %s", type(e).__name__, e)
+            return self._fallback_results(query, num_results)
+
+        return self._finish_results(response_text, query, num_results, cache_key)
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        num_results: int = DEFAULT_NUM_RESULTS
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Run several searches concurrently on one event loop.
+
+        All queries are launched with asyncio.gather, so total latency
+        approaches the slowest single generation instead of the sum.
+        Individual failures degrade to fallback results for that query
+        only — one bad response never sinks the batch.
+
+        Args:
+            queries (List[str]): Search queries
+            num_results (int): Results per query (default: 3, max: 10)
+
+        Returns:
+            Dict[str, List[Dict[str, str]]]: Mapping of each query to
+                its result list
+
+        Example:
+            >>> tool = GoogleSearchTool()
+            >>> batch = asyncio.run(
+            ...     tool.search_batch(["llm agents", "vector search"])
+            ... )
+        """
+        outcomes = await asyncio.gather(
+            *(self.search_async(q, num_results) for q in queries),
+            return_exceptions=True
+        )
+
+        results = {}
+        for query, outcome in zip(queries, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("✗ Batch query '%s' failed: %s", query, outcome)
+                results[query] = self._fallback_results(query, num_results)
+            else:
+                results[query] = outcome
+        return results
+
+    def _build_prompt(self, query: str, num_results: int) -> str:
+        """
+        Construct the result-generation prompt for a single query.
+
+        Args:
+            query (str): Search query
+            num_results (int): Capped result count
+
+        Returns:
+            str: Full prompt text
+        """
+        return self._PROMPT_TEMPLATE.format(
+            n=num_results, query=query, domains=self._DOMAIN_LIST
+        )
+
+    def _finish_results(
+        self,
+        response_text: str,
+        query: str,
+        num_results: int,
+        cache_key: str
+    ) -> List[Dict[str, str]]:
+        """
+        Parse, validate, pad, and cache a raw Gemini response.
+
+        Shared tail of search() and search_async(), so the sync and
+        async paths cannot drift apart.
+
+        Args:
+            response_text (str): Raw text from the API
+            query (str): Original search query
+            num_results (int): Requested result count
+            cache_key (str): Key to store validated output under
+
+        Returns:
+            List[Dict[str, str]]: Validated results, or fallbacks on
+                a parse failure
+        """
+        try:
             # Clean response - remove markdown code blocks
-            response_text = response_text.replace('```json', '').replace('```', '').strip()
-            
+            response_text = _CODEFENCE_RE.sub('', response_text).strip()
+
             # Parse JSON
-            results = json.loads(response_text)
-            
+            results = _json_loads(response_text)
+
             # Validate structure
             if not isinstance(results, list):
                 raise ValueError("Response is not a list")
-            
-            # Validate each result
-            validated_results = self._validate_results(results, query)
-            
-            # Ensure we have the requested number
-            if len(validated_results) < num_results:
-                print(f"[GoogleSearchTool] ⚠ Only {len(validated_results)}/{num_results} valid results, padding...")
-                validated_results.extend(
-                    self._generate_padding_results(query, num_results - len(validated_results))
-                )
-            
-            print(f"[GoogleSearchTool] ✓ Generated {len(validated_results)} result(s)")
-            
-            # Log first result as sample
-            if validated_results:
-                sample = validated_results[0]
-                print(f"[GoogleSearchTool] Sample: '{sample['title'][:50]}...'")
-            
-            return validated_results
-            
-        except json.JSONDecodeError as e:
-            print(f"[GoogleSearchTool] ✗ JSON parsing error: {e}")
-            print(f"[GoogleSearchTool] Response preview: {response_text[:200]}...")
+
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning("✗ JSON parsing error: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response preview: %s...", response_text[:200])
             return self._fallback_results(query, num_results)
-            
+
+        # Validate each result
+        validated_results = self._validate_results(results, query)
+
+        # Ensure we have the requested number
+        if len(validated_results) < num_results:
+            logger.debug("⚠ Only %d/%d valid results, padding...",
+                         len(validated_results), num_results)
+            validated_results.extend(
+                self._generate_padding_results(query, num_results - len(validated_results))
+            )
+
+        logger.debug("✓ Generated %d result(s)", len(validated_results))
+
+        # Log first result as sample; the slice only happens when DEBUG
+        # records are actually emitted
+        if validated_results and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sample: '%s...'", validated_results[0]['title'][:50])
+
+        # Persist only real API output — fallbacks stay uncached so
+        # a transient failure never poisons future hits
+        self._cache_put(cache_key, validated_results)
+
+        return validated_results
+
+    @retry_on_rate_limit(max_retries=3, backoff_factor=2)
+    def search_many(
+        self,
+        queries: List[str],
+        num_results: int = DEFAULT_NUM_RESULTS
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Generate search results for several queries in one API call.
+
+        Instead of K sequential generate_content round-trips (each with
+        its own latency and rate-limit tick), all queries go into a
+        single prompt and come back as one JSON object keyed by query.
+        Per-query cache hits are served first; only the misses are sent
+        to the API.
+
+        Args:
+            queries (List[str]): Search queries
+            num_results (int): Results per query (default: 3, max: 10)
+
+        Returns:
+            Dict[str, List[Dict[str, str]]]: Mapping of each query to
+                its result list (same structure as search())
+
+        Error Handling:
+            - Rate limiting: Applied via decorator, once per batch
+            - Malformed or missing per-query output: falls back to
+              _fallback_results for that query only
+            - API failure: every uncached query gets fallback results
+
+        Example:
+            >>> tool = GoogleSearchTool()
+            >>> batch = tool.search_many(["ai agents", "vector databases"])
+            >>> for query, results in batch.items():
+            ...     print(f"{query}: {len(results)} results")
+        """
+        num_results = max(1, min(num_results, self.MAX_RESULTS))
+
+        # Serve cache hits first; only misses cost an API call
+        results: Dict[str, List[Dict[str, str]]] = {}
+        pending = []
+        for query in queries:
+            cached = self._cache_get(self._cache_key(query, num_results))
+            if cached is not None:
+                results[query] = cached
+            else:
+                pending.append(query)
+
+        if not pending:
+            return results
+
+        if self.cache_mode == 'replay':
+            raise LookupError(
+                f"Replay cache miss for {len(pending)} quer(ies): {pending}"
+            )
+
+        logger.info("Batch searching %d quer(ies) in one call...", len(pending))
+
+        # One rate-limit tick for the whole batch
+        rate_limiter = get_rate_limiter()
+        rate_limiter.wait_if_needed()
+
+        numbered = '\n'.join(f'{i}. "{q}"' for i, q in enumerate(pending, 1))
+        prompt = self._BATCH_PROMPT_TEMPLATE.format(
+            n=num_results,
+            queries=numbered,
+            domains=self._DOMAIN_LIST,
+            count=len(pending)
+        )
+
+        payload = {}
+        try:
+            response = self.model.generate_content(prompt, stream=True)
+            response_text = _collect_stream(response, '{', '}').strip()
+            response_text = _CODEFENCE_RE.sub('', response_text).strip()
+            payload = _json_loads(response_text)
+            if not isinstance(payload, dict):
+                raise ValueError("Response is not a JSON object")
         except Exception as e:
-            print(f"[GoogleSearchTool] ✗ Error: {type(e).__name__}: {e}")
-            return self._fallback_results(query, num_results)
-    
+            logger.warning("✗ Batch error: %s: %s", type(e).__name__, e)
+            payload = {}
+
+        for query in pending:
+            raw = payload.get(query)
+            if isinstance(raw, list):
+                validated = self._validate_results(raw, query)
+                if len(validated) < num_results:
+                    validated.extend(
+                        self._generate_padding_results(
+                            query, num_results - len(validated)
+                        )
+                    )
+                validated = validated[:num_results]
+                self._cache_put(self._cache_key(query, num_results), validated)
+                results[query] = validated
+            else:
+                # Missing or malformed entry: degrade for this query only
+                results[query] = self._fallback_results(query, num_results)
+
+        logger.debug("✓ Batch complete: %d quer(ies)", len(results))
+        return results
+
+    def _cache_key(self, query: str, num_results: int) -> str:
+        """
+        Build the content-addressed cache key for a search call.
+
+        Args:
+            query (str): Search query
+            num_results (int): Capped result count
+
+        Returns:
+            str: SHA256 hex digest over query, model name, and count
+        """
+        raw = f"{query}|{self.MODEL_NAME}|{num_results}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _cache_get(self, cache_key: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Load cached results for a key, if the policy allows reads.
+
+        Args:
+            cache_key (str): Key from _cache_key
+
+        Returns:
+            Optional[List[Dict[str, str]]]: Cached results, or None on
+                miss, unreadable entry, or a write-only/off policy
+        """
+        if self.cache_mode in ('off', 'write-only'):
+            return None
+
+        path = self.CACHE_DIR / f"{cache_key}.json"
+        try:
+            results = _json_loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None  # Missing or corrupt: treat as a miss
+
+        return results if isinstance(results, list) else None
+
+    def _cache_put(self, cache_key: str, results: List[Dict[str, str]]) -> None:
+        """
+        Persist validated results, if the policy allows writes.
+
+        The write lands atomically via a temp file and os.replace so an
+        interrupted process can never leave a truncated JSON entry.
+
+        Args:
+            cache_key (str): Key from _cache_key
+            results (List[Dict[str, str]]): Validated search results
+        """
+        if self.cache_mode not in ('enabled', 'write-only'):
+            return
+
+        path = self.CACHE_DIR / f"{cache_key}.json"
+        try:
+            tmp_path = str(path) + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("⚠ Cache write failed: %s", e)
+
     def _validate_results(
         self, 
         results: List[Any], 
@@ -317,16 +774,18 @@ Generate {num_results} high-quality results now:"""
         """
         validated = []
         seen_titles = set()
-        
+        # Slug computed once up front instead of per invalid URL
+        slug = query.replace(' ', '-')
+
         for i, result in enumerate(results):
             # Check type
             if not isinstance(result, dict):
-                print(f"[GoogleSearchTool] ⚠ Result {i+1} is not a dict, skipping")
+                logger.debug("⚠ Result %d is not a dict, skipping", i + 1)
                 continue
             
             # Check required keys
-            if not all(key in result for key in ['title', 'snippet', 'url']):
-                print(f"[GoogleSearchTool] ⚠ Result {i+1} missing required keys, skipping")
+            if not self._REQUIRED_KEYS.issubset(result):
+                logger.debug("⚠ Result %d missing required keys, skipping", i + 1)
                 continue
             
             # Extract and validate fields
@@ -336,18 +795,20 @@ Generate {num_results} high-quality results now:"""
             
             # Check for empty values
             if not title or not snippet or not url:
-                print(f"[GoogleSearchTool] ⚠ Result {i+1} has empty fields, skipping")
+                logger.debug("⚠ Result %d has empty fields, skipping", i + 1)
                 continue
             
-            # Check for duplicates
-            if title in seen_titles:
-                print(f"[GoogleSearchTool] ⚠ Duplicate title detected, skipping")
+            # Check for duplicates on a normalized form: case and
+            # whitespace differences no longer sneak copies through
+            norm_title = _WS_RE.sub(' ', title).strip().casefold()
+            if norm_title in seen_titles:
+                logger.debug("⚠ Duplicate title detected, skipping")
                 continue
             
             # Validate URL format
-            if not (url.startswith('http://') or url.startswith('https://')):
-                url = f"https://example.com/{query.replace(' ', '-')}-{i+1}"
-                print(f"[GoogleSearchTool] ⚠ Invalid URL, replaced with placeholder")
+            if not url.startswith(self._VALID_URL_SCHEMES):
+                url = f"https://example.com/{slug}-{i+1}"
+                logger.debug("⚠ Invalid URL, replaced with placeholder")
             
             # Add validated result
             validated.append({
@@ -356,8 +817,8 @@ Generate {num_results} high-quality results now:"""
                 'url': url
             })
             
-            seen_titles.add(title)
-        
+            seen_titles.add(norm_title)
+
         return validated
     
     def _generate_padding_results(
@@ -375,24 +836,20 @@ Generate {num_results} high-quality results now:"""
         Returns:
             List[Dict[str, str]]: Padding results
         """
-        padding = []
-        
-        variations = [
-            f"Introduction to {query}",
-            f"Understanding {query}: A Comprehensive Guide",
-            f"Latest Research on {query}",
-            f"Practical Applications of {query}",
-            f"{query}: Key Concepts and Trends"
+        # Interpolate once per call: slug and snippet are shared by
+        # every padding entry
+        slug = query.replace(' ', '-')
+        snippet = self._PADDING_SNIPPET.format(q=query)
+        n_titles = len(self._PADDING_TITLES)
+
+        return [
+            {
+                'title': self._PADDING_TITLES[i % n_titles].format(q=query),
+                'snippet': snippet,
+                'url': f"https://example.com/{slug}-{i+1}"
+            }
+            for i in range(count)
         ]
-        
-        for i in range(count):
-            padding.append({
-                'title': variations[i % len(variations)],
-                'snippet': f"Comprehensive information about {query} and related topics. This resource provides detailed insights and practical guidance.",
-                'url': f"https://example.com/{query.replace(' ', '-')}-{i+1}"
-            })
-        
-        return padding
     
     def _fallback_results(
         self, 
@@ -418,37 +875,19 @@ Generate {num_results} high-quality results now:"""
             - Maintains pipeline flow
             - Clear indication these are fallbacks
         """
-        print(f"[GoogleSearchTool] ⚠ Using fallback results")
-        
-        templates = [
-            {
-                "title": f"Comprehensive Guide to {query}",
-                "snippet": f"An in-depth exploration of {query}, covering fundamental concepts and recent developments. This resource provides valuable insights for researchers and practitioners.",
-                "url": f"https://example.com/guide-{query.replace(' ', '-')}"
-            },
-            {
-                "title": f"Research Insights: {query}",
-                "snippet": f"Current research findings and analysis related to {query}. Includes expert perspectives and evidence-based recommendations.",
-                "url": f"https://example.com/research-{query.replace(' ', '-')}"
-            },
-            {
-                "title": f"Understanding {query}: Key Concepts",
-                "snippet": f"Essential information about {query} for beginners and experts alike. Covers fundamental principles and practical applications.",
-                "url": f"https://example.com/understanding-{query.replace(' ', '-')}"
-            },
-            {
-                "title": f"Latest Trends in {query}",
-                "snippet": f"Emerging trends and developments in the field of {query}. Stay updated with cutting-edge research and innovations.",
-                "url": f"https://example.com/trends-{query.replace(' ', '-')}"
-            },
+        logger.warning("⚠ Using fallback results")
+
+        # Slug computed once instead of once per template
+        slug = query.replace(' ', '-')
+
+        return [
             {
-                "title": f"Practical Applications of {query}",
-                "snippet": f"Real-world applications and use cases for {query}. Learn how professionals are leveraging these concepts in practice.",
-                "url": f"https://example.com/applications-{query.replace(' ', '-')}"
+                'title': title.format(q=query),
+                'snippet': snippet.format(q=query),
+                'url': url.format(slug=slug)
             }
+            for title, snippet, url in self._FALLBACK_TEMPLATES[:num_results]
         ]
-        
-        return templates[:num_results]
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -474,10 +913,29 @@ Generate {num_results} high-quality results now:"""
 
 
 # Module-level utility functions
+@lru_cache(maxsize=1)
+def _default_tool() -> GoogleSearchTool:
+    """
+    Build the process-wide GoogleSearchTool on first use.
+
+    Construction re-reads env vars, reconfigures genai, and
+    instantiates the GenerativeModel — work worth doing once, not per
+    search_web call. lru_cache makes the lazy init thread-safe under
+    the GIL.
+
+    Returns:
+        GoogleSearchTool: Shared singleton instance
+    """
+    return GoogleSearchTool()
+
+
 def search_web(query: str, num_results: int = 3) -> List[Dict[str, str]]:
     """
     Convenience function to search without instantiating tool.
-    
+
+    Reuses one lazily created module-level GoogleSearchTool across
+    calls, so repeated invocations pay only the Gemini request itself.
+
     Args:
         query (str): Search query
         num_results (int): Number of results
@@ -490,52 +948,11 @@ def search_web(query: str, num_results: int = 3) -> List[Dict[str, str]]:
         >>> for r in results:
         ...     print(r['title'])
     """
-    tool = GoogleSearchTool()
-    return tool.search(query, num_results)
+    return _default_tool().search(query, num_results)
 
 
 if __name__ == "__main__":
-    # Demo/testing code
-    print("GoogleSearchTool Demo")
-    print("=" * 60)
-    
-    try:
-        # Initialize tool
-        tool = GoogleSearchTool()
-        
-        # Test queries
-        test_queries = [
-            ("artificial intelligence", 3),
-            ("quantum computing applications", 5),
-            ("climate change solutions", 4)
-        ]
-        
-        for query, num_results in test_queries:
-            print(f"\n{'='*60}")
-            print(f"TEST QUERY: '{query}' ({num_results} results)")
-            print(f"{'='*60}")
-            
-            results = tool.search(query, num_results)
-            
-            print(f"\n📊 RESULTS ({len(results)}):")
-            for i, result in enumerate(results, 1):
-                print(f"\n{i}. {result['title']}")
-                print(f"   URL: {result['url']}")
-                print(f"   Snippet: {result['snippet'][:100]}...")
-        
-        # Test statistics
-        print(f"\n\n{'='*60}")
-        print("📈 TOOL STATISTICS")
-        print(f"{'='*60}")
-        stats = tool.get_statistics()
-        for key, value in stats.items():
-            print(f"  {key}: {value}")
-        
-        print("\n✓ All tests passed!")
-        print("\n⚠️ REMINDER: These are simulated results for demo purposes")
-        print("⚠️ For production, integrate real search API")
-        
-    except Exception as e:
-        print(f"\n❌ Demo failed: {e}")
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
+    # Demo lives in its own module so importing this file never
+    # compiles the multi-query test body
+    from _demo_google_search import main
+    main()
@@ -8,20 +8,71 @@ Author: Google Hackathon Team
 License: MIT
 """
 
+import asyncio
+import itertools
 import logging
+import math
+import random
 import re
 import time
+from collections import deque
+from contextlib import contextmanager
 from functools import wraps
-from typing import Optional, Callable, Any
-from threading import Lock
+from typing import Mapping, Optional, Callable, Any
+from threading import Lock, Semaphore
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Module logger: bound once so hot-path calls skip the root-logger
+# hierarchy walk, and %-style arguments defer all message formatting
+# until a handler actually wants the record. Handler/level setup is
+# the application's job (configuring it here would clobber caller
+# config); the __main__ demo configures its own.
+logger = logging.getLogger(__name__)
+
+# Unioned wait-time pattern, compiled once at import: one linear scan
+# replaces up to five re.search passes per rate-limit retry, and the
+# IGNORECASE flag makes the lowercased message copy unnecessary
+_WAIT_RE = re.compile(
+    r'(?:retry in|retry after|wait)\s+(\d+(?:\.\d+)?)\s*(?:seconds?|s)\b',
+    re.IGNORECASE
 )
 
+# Shared pause deadline (monotonic seconds) across every
+# retry_on_rate_limit wrapper: when one call hits a 429, concurrent
+# callers sleep toward the same deadline instead of each serving its
+# own full backoff — aggregate sleep drops from N x wait to roughly
+# one wait of wall clock, and a small jitter spreads the re-fires so
+# they don't all thaw at once (thundering-herd mitigation)
+_global_pause_until = 0.0
+_global_pause_lock = Lock()
+
+# Jitter ceiling in seconds appended after a shared pause
+_RETRY_JITTER_MAX = 0.5
+
+
+def _join_shared_pause(jittered: float) -> tuple:
+    """
+    Fold one caller's jittered wait into the shared pause deadline.
+
+    Args:
+        jittered (float): This caller's desired wait in seconds
+
+    Returns:
+        tuple: (remaining_seconds, adopted_shared) — how long to sleep
+               and whether an existing (later) deadline was adopted,
+               in which case the caller should add re-fire jitter
+    """
+    global _global_pause_until
+    target = time.monotonic() + jittered
+    with _global_pause_lock:
+        if target > _global_pause_until:
+            _global_pause_until = target
+            adopted_shared = False
+        else:
+            target = _global_pause_until
+            adopted_shared = True
+    return target - time.monotonic(), adopted_shared
+
 
 class RateLimiter:
     """
@@ -34,8 +85,9 @@ class RateLimiter:
     Key Features:
     
     1. Automatic Throttling:
-       - Calculates minimum interval between requests
-       - Automatically sleeps if requests are too frequent
+       - Sliding 60-second window of recent request times
+       - Bursts up to the full quota are admitted immediately
+       - Automatically sleeps only once the window is exhausted
        - Thread-safe for concurrent usage
     
     2. Flexible Configuration:
@@ -56,18 +108,22 @@ class RateLimiter:
     
     Attributes:
         requests_per_minute (int): Maximum allowed requests per minute
-        min_interval (float): Minimum seconds between requests
-        last_request_time (float): Timestamp of last request
+        min_interval (float): Average seconds between sustained requests
+        _min_interval_ns (int): Average interval in integer nanoseconds
+        _window (deque): Monotonic ns admission times, maxlen = quota
         _lock (Lock): Thread synchronization lock
-        _request_count (int): Total requests processed
+        _count_iter (itertools.count): Atomic request-number source
+        _request_count (int): Last issued request number (for stats)
     
     Mathematical Model:
-        min_interval = 60 / requests_per_minute
-        
-        Examples:
-        - 10 req/min → 6.0s interval
-        - 20 req/min → 3.0s interval
-        - 60 req/min → 1.0s interval
+        A request waits only when requests_per_minute admissions
+        already happened in the trailing 60 seconds; it then sleeps
+        until the oldest of them falls out of the window.
+
+        Examples (sustained load):
+        - 10 req/min → first 10 calls immediate, then ~6.0s spacing
+        - 60 req/min → first 60 calls immediate, then ~1.0s spacing
+        - 1000 req/min → first 1000 calls immediate, then ~0.06s spacing
     
     Example Usage:
         >>> limiter = RateLimiter(requests_per_minute=10)
@@ -92,15 +148,38 @@ class RateLimiter:
     # Default configuration
     DEFAULT_REQUESTS_PER_MINUTE = 10
     MIN_REQUESTS_PER_MINUTE = 1
-    MAX_REQUESTS_PER_MINUTE = 60
+    MAX_REQUESTS_PER_MINUTE = 10000
+
+    # Sliding-window length in integer nanoseconds
+    _WINDOW_NS = 60_000_000_000
+
+    # Waits at or under this (seconds) busy-spin instead of sleeping
+    # when high_precision is enabled: time.sleep rounds sub-ms waits
+    # up to a full scheduler tick (~1ms on Linux), over-throttling
+    # high-RPM configurations
+    _SPIN_THRESHOLD = 0.002
+
+    # Sentinel for "no request yet": far enough in the past that the
+    # first projected slot is always now
+    _NEVER_NS = -(1 << 62)
     
-    def __init__(self, requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE):
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        high_precision: bool = False
+    ):
         """
         Initialize rate limiter with specified request quota.
         
         Args:
-            requests_per_minute (int): Maximum requests per minute (1-60).
+            requests_per_minute (int): Maximum requests per minute (1-10000).
                                       Default: 10 requests/minute (6s interval)
+            high_precision (bool): Busy-spin instead of sleeping for
+                                  waits under ~2ms. Opt-in: it burns a
+                                  core while spinning, but avoids the
+                                  scheduler rounding sub-ms sleeps up
+                                  to a full tick. Only relevant at
+                                  high RPM. Default: False
         
         Raises:
             ValueError: If requests_per_minute is out of valid range
@@ -114,6 +193,9 @@ class RateLimiter:
             
             >>> # Aggressive rate limiting (use carefully!)
             >>> limiter = RateLimiter(requests_per_minute=30)
+            
+            >>> # High-RPM paid tier
+            >>> limiter = RateLimiter(requests_per_minute=1000)
         """
         # Validate input
         if not self.MIN_REQUESTS_PER_MINUTE <= requests_per_minute <= self.MAX_REQUESTS_PER_MINUTE:
@@ -123,14 +205,36 @@ class RateLimiter:
             )
         
         self.requests_per_minute = requests_per_minute
+        self.high_precision = high_precision
         self.min_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0.0
+        # Hot-path timing in integer nanoseconds: monotonic_ns avoids
+        # both wall-clock jumps and per-call float boxing, and the slot
+        # math below becomes integer compare/add. Seconds appear only
+        # at the time.sleep call and in reported statistics.
+        self._min_interval_ns = 60_000_000_000 // requests_per_minute
+        # Sliding window of the last requests_per_minute admission
+        # times (monotonic ns). A request only waits when the window
+        # is full AND its oldest entry is still inside the last 60
+        # seconds — so a fresh burst of up to requests_per_minute
+        # calls is admitted immediately, matching real provider RPM
+        # semantics instead of a strict minimum spacing.
+        self._window: deque = deque(maxlen=requests_per_minute)
+        # Reactive pause deadline (monotonic ns) fed by response
+        # headers via update_from_headers; 0 means no pause
+        self._pause_until_ns = 0
         self._lock = Lock()
+        # next() on itertools.count is a single C call — atomic under
+        # the GIL — so the lock-free fast path can take a request
+        # number without losing increments the way a Python-level
+        # += read-modify-write can. _request_count mirrors the last
+        # issued number for statistics; the store is atomic, so it can
+        # only ever lag by in-flight requests, never lose counts.
+        self._count_iter = itertools.count(1)
         self._request_count = 0
         
-        logging.info(
-            f"[RateLimiter] ✓ Initialized: {requests_per_minute} req/min "
-            f"(min interval: {self.min_interval:.2f}s)"
+        logger.info(
+            "[RateLimiter] ✓ Initialized: %d req/min (min interval: %.2fs)",
+            requests_per_minute, self.min_interval
         )
     
     def wait_if_needed(self) -> float:
@@ -142,44 +246,180 @@ class RateLimiter:
         
         Returns:
             float: Actual time waited in seconds (0 if no wait needed)
-        
+
         Thread Safety:
-            Uses lock to ensure thread-safe operation. Multiple threads
-            will queue and each will respect the rate limit.
-        
+            Each caller reserves its time slot under the lock, then
+            sleeps outside it — concurrent threads space themselves one
+            min_interval apart instead of queueing on the lock for the
+            full duration of each other's sleeps.
+
         Example:
             >>> limiter = RateLimiter(requests_per_minute=10)
-            >>> 
+            >>>
             >>> # Before API call
             >>> wait_time = limiter.wait_if_needed()
             >>> print(f"Waited {wait_time:.2f}s")
-            >>> 
+            >>>
             >>> # Make API call
             >>> response = api_call()
         """
-        with self._lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            
-            # Calculate required wait time
-            wait_needed = self.min_interval - time_since_last
-            
-            if wait_needed > 0:
-                logging.info(
-                    f"[RateLimiter] ⏳ Throttling: waiting {wait_needed:.2f}s "
-                    f"(request #{self._request_count + 1})"
-                )
+        wait_needed, request_number = self._reserve_slot()
+        if wait_needed > 0:
+            logger.info(
+                "[RateLimiter] ⏳ Throttling: waiting %.2fs (request #%d)",
+                wait_needed, request_number
+            )
+            if self.high_precision and wait_needed <= self._SPIN_THRESHOLD:
+                # Sub-ms sleeps get rounded up to a scheduler tick;
+                # spinning resolves them with microsecond precision
+                deadline = time.monotonic() + wait_needed
+                while time.monotonic() < deadline:
+                    pass
+            else:
                 time.sleep(wait_needed)
-                actual_wait = wait_needed
+        return wait_needed
+
+    async def wait_if_needed_async(self) -> float:
+        """
+        Async variant of wait_if_needed for asyncio callers.
+
+        Identical timing math, but the throttle sleep is awaited via
+        asyncio.sleep, so a rate-limited coroutine yields the event
+        loop instead of stalling every other coroutine sharing it.
+        The slot reservation itself only holds the (threading) lock
+        for a handful of integer ops, never across an await, so sync
+        and async callers can safely share one limiter instance.
+
+        Returns:
+            float: Actual time waited in seconds (0 if no wait needed)
+
+        Example:
+            >>> limiter = get_rate_limiter()
+            >>> await limiter.wait_if_needed_async()
+            >>> response = await api_call_async()
+        """
+        wait_needed, request_number = self._reserve_slot()
+        if wait_needed > 0:
+            logger.info(
+                "[RateLimiter] ⏳ Throttling: waiting %.2fs (request #%d)",
+                wait_needed, request_number
+            )
+            await asyncio.sleep(wait_needed)
+        return wait_needed
+
+    def _reserve_slot(self) -> tuple:
+        """
+        Reserve the next admission slot and return the wait it needs.
+
+        Shared by the sync and async wait paths: all the timing math
+        happens here, the caller only decides how to sleep.
+
+        Returns:
+            tuple: (wait_seconds, request_number)
+        """
+        # Uncongested fast path: window not yet full, or its oldest
+        # entry comfortably outside the 60s window (2x margin) — skip
+        # the lock entirely. deque.append and the reads are each
+        # atomic under the GIL, and the margin absorbs the benign race
+        # where two threads take this path at once.
+        now_ns = time.monotonic_ns()
+        window = self._window
+        if now_ns >= self._pause_until_ns and (
+            len(window) < window.maxlen
+            or now_ns - window[0] > 2 * self._WINDOW_NS
+        ):
+            window.append(now_ns)
+            request_number = next(self._count_iter)
+            self._request_count = request_number
+            return 0.0, request_number
+
+        # Reserve the next admission slot: the critical section is a
+        # handful of integer ops, never a sleep. Appending the
+        # projected admission time (not now) keeps concurrent callers
+        # correctly spaced.
+        with self._lock:
+            now_ns = time.monotonic_ns()
+            if len(window) == window.maxlen:
+                target_ns = window[0] + self._WINDOW_NS
+                if target_ns < now_ns:
+                    target_ns = now_ns
             else:
-                actual_wait = 0.0
-            
-            # Update timestamp and counter
-            self.last_request_time = time.time()
-            self._request_count += 1
-            
-            return actual_wait
-    
+                target_ns = now_ns
+            # Honor any header-driven pause on top of the window slot
+            if self._pause_until_ns > target_ns:
+                target_ns = self._pause_until_ns
+            window.append(target_ns)
+            request_number = next(self._count_iter)
+            self._request_count = request_number
+
+        wait_ns = target_ns - now_ns
+        if wait_ns > 0:
+            return wait_ns / 1e9, request_number
+        return 0.0, request_number
+
+    def update_from_headers(self, headers: Mapping[str, Any]) -> None:
+        """
+        React to rate-limit response headers from the API provider.
+
+        The limiter is proactive by default; this method adds the
+        reactive half. Feed it the headers of each API response and it
+        pauses upcoming requests when the provider signals depleted
+        capacity — before any 429 is hit, instead of after.
+
+        Recognized headers (case-insensitive):
+            - Retry-After: explicit pause in seconds
+            - x-ratelimit-remaining-requests /
+              anthropic-ratelimit-requests-remaining /
+              x-ratelimit-remaining: remaining request budget; when it
+              drops to <=2 or below 10% of the configured quota, the
+              limiter pauses for one min_interval to let it recover
+
+        Args:
+            headers (Mapping[str, Any]): Response headers, any casing
+
+        Example:
+            >>> limiter = get_rate_limiter()
+            >>> response = api_call()
+            >>> limiter.update_from_headers(response.headers)
+        """
+        lowered = {str(key).lower(): value for key, value in headers.items()}
+
+        pause_seconds = None
+        retry_after = lowered.get('retry-after')
+        if retry_after is not None:
+            try:
+                pause_seconds = float(retry_after)
+            except (TypeError, ValueError):
+                pause_seconds = None
+
+        if pause_seconds is None:
+            remaining = None
+            for key in ('x-ratelimit-remaining-requests',
+                        'anthropic-ratelimit-requests-remaining',
+                        'x-ratelimit-remaining'):
+                value = lowered.get(key)
+                if value is None:
+                    continue
+                try:
+                    remaining = int(float(value))
+                except (TypeError, ValueError):
+                    continue
+                break
+            if remaining is not None:
+                threshold = max(2, self.requests_per_minute // 10)
+                if remaining <= threshold:
+                    pause_seconds = self.min_interval
+
+        if pause_seconds is not None and pause_seconds > 0:
+            pause_until_ns = time.monotonic_ns() + int(pause_seconds * 1e9)
+            with self._lock:
+                if pause_until_ns > self._pause_until_ns:
+                    self._pause_until_ns = pause_until_ns
+            logger.info(
+                "[RateLimiter] ⏸️ Header-driven pause: %.2fs (provider capacity low)",
+                pause_seconds
+            )
+
     def get_statistics(self) -> dict:
         """
         Get rate limiter statistics and configuration.
@@ -189,7 +429,8 @@ class RateLimiter:
                 - requests_per_minute: Configured rate limit
                 - min_interval: Minimum seconds between requests
                 - total_requests: Total requests processed
-                - last_request_time: Timestamp of last request
+                - last_request_time: Monotonic timestamp of last request
+                  (-inf if no request has been made yet)
                 - time_since_last: Seconds since last request
         
         Example:
@@ -199,14 +440,19 @@ class RateLimiter:
             >>> print(f"Processed {stats['total_requests']} requests")
         """
         with self._lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time if self.last_request_time > 0 else 0
-            
+            if self._window:
+                last_ns = self._window[-1]
+                time_since_last = (time.monotonic_ns() - last_ns) / 1e9
+                last_request_time = last_ns / 1e9
+            else:
+                time_since_last = 0.0
+                last_request_time = float('-inf')
+
             return {
                 'requests_per_minute': self.requests_per_minute,
                 'min_interval': self.min_interval,
                 'total_requests': self._request_count,
-                'last_request_time': self.last_request_time,
+                'last_request_time': last_request_time,
                 'time_since_last': time_since_last
             }
     
@@ -224,9 +470,446 @@ class RateLimiter:
             >>> # Fresh start with no wait required
         """
         with self._lock:
-            self.last_request_time = 0.0
+            self._window.clear()
+            self._pause_until_ns = 0
+            self._count_iter = itertools.count(1)
             self._request_count = 0
-            logging.info("[RateLimiter] ✓ Reset complete")
+            logger.info("[RateLimiter] ✓ Reset complete")
+
+
+class ConcurrencyLimiter:
+    """
+    AIMD-based concurrency limiter for in-flight request backpressure.
+
+    RateLimiter controls request *rate*; this class controls request
+    *concurrency*. When the provider slows down or starts returning
+    429/5xx, letting every worker thread keep hammering it only makes
+    the spike worse. The limiter bounds in-flight calls with a
+    semaphore whose permit count is self-tuned TCP-style (AIMD:
+    additive increase, multiplicative decrease):
+
+    - Healthy call (no error, rolling average latency <= target):
+      concurrency grows by ADDITIVE_INCREASE (0.5)
+    - Rate-limit/server error, or average latency above target:
+      concurrency halves (MULTIPLICATIVE_DECREASE = 0.5)
+
+    Attributes:
+        target_latency (float): Rolling-average latency goal in seconds
+        max_concurrency (int): Hard upper bound on permits
+        _c (float): Current AIMD concurrency value
+        _permits (int): Permits currently materialized in the semaphore
+        _sem (Semaphore): Gate for in-flight calls
+        _latencies (deque): Rolling window of recent call latencies
+
+    Example:
+        >>> limiter = ConcurrencyLimiter(initial_concurrency=4)
+        >>> with limiter.admit():
+        ...     response = api_call()  # latency/errors tune the cap
+
+    Thread Safety:
+        Safe to share across threads; bookkeeping happens under an
+        internal lock, waiting happens on the semaphore.
+    """
+
+    # AIMD tuning (TCP-style congestion control)
+    ADDITIVE_INCREASE = 0.5
+    MULTIPLICATIVE_DECREASE = 0.5
+
+    # Rolling latency window size
+    LATENCY_WINDOW = 20
+
+    # Concurrency bounds
+    MIN_CONCURRENCY = 1
+    DEFAULT_MAX_CONCURRENCY = 16
+
+    # Error substrings that signal provider backpressure
+    _BACKPRESSURE_MARKERS = (
+        '429', '500', '502', '503', '504', '529',
+        'rate limit', 'quota exceeded', 'too many requests', 'overloaded'
+    )
+
+    def __init__(
+        self,
+        initial_concurrency: int = 4,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        target_latency: float = 10.0
+    ):
+        """
+        Initialize the AIMD concurrency limiter.
+
+        Args:
+            initial_concurrency (int): Starting permit count (default: 4)
+            max_concurrency (int): Hard cap on permits (default: 16)
+            target_latency (float): Average latency in seconds above
+                                    which concurrency shrinks (default: 10.0)
+
+        Raises:
+            ValueError: If bounds are inconsistent or non-positive
+        """
+        if not self.MIN_CONCURRENCY <= initial_concurrency <= max_concurrency:
+            raise ValueError(
+                f"initial_concurrency must be between {self.MIN_CONCURRENCY} "
+                f"and max_concurrency ({max_concurrency}), got {initial_concurrency}"
+            )
+        if target_latency <= 0:
+            raise ValueError(f"target_latency must be positive, got {target_latency}")
+
+        self.target_latency = target_latency
+        self.max_concurrency = max_concurrency
+        self._c = float(initial_concurrency)
+        self._permits = initial_concurrency
+        self._sem = Semaphore(initial_concurrency)
+        self._latencies: deque = deque(maxlen=self.LATENCY_WINDOW)
+        self._lock = Lock()
+
+        logger.info(
+            "[ConcurrencyLimiter] ✓ Initialized: %d permits "
+            "(max %d, target latency %.1fs)",
+            initial_concurrency, max_concurrency, target_latency
+        )
+
+    @contextmanager
+    def admit(self):
+        """
+        Admit one call, blocking while the concurrency cap is reached.
+
+        Use as a context manager around the protected call; latency
+        and errors observed inside the block feed the AIMD controller.
+
+        Example:
+            >>> with limiter.admit():
+            ...     result = api_call()
+        """
+        self._sem.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as error:
+            self._record(time.monotonic() - start, error)
+            raise
+        else:
+            self._record(time.monotonic() - start, None)
+        finally:
+            self._sem.release()
+
+    def _record(self, latency: float, error: Optional[Exception]) -> None:
+        """
+        Update the AIMD controller with one call's outcome.
+
+        Args:
+            latency (float): Observed call duration in seconds
+            error (Optional[Exception]): Exception raised, if any
+        """
+        congested = False
+        if error is not None:
+            error_low = str(error).casefold()
+            congested = any(
+                marker in error_low for marker in self._BACKPRESSURE_MARKERS
+            )
+
+        with self._lock:
+            self._latencies.append(latency)
+            avg_latency = sum(self._latencies) / len(self._latencies)
+
+            if congested or avg_latency > self.target_latency:
+                new_c = max(
+                    float(self.MIN_CONCURRENCY),
+                    self._c * self.MULTIPLICATIVE_DECREASE
+                )
+            elif error is None:
+                new_c = min(
+                    float(self.max_concurrency),
+                    self._c + self.ADDITIVE_INCREASE
+                )
+            else:
+                # Unrelated failure: leave the cap alone
+                new_c = self._c
+            self._c = new_c
+
+            # Materialize the new cap in the semaphore. Shrinking is
+            # best-effort: permits currently held by in-flight calls
+            # are reclaimed as they come back through later _record
+            # calls.
+            new_permits = max(self.MIN_CONCURRENCY, math.ceil(new_c))
+            while self._permits < new_permits:
+                self._sem.release()
+                self._permits += 1
+            while self._permits > new_permits:
+                if not self._sem.acquire(blocking=False):
+                    break
+                self._permits -= 1
+
+    def get_statistics(self) -> dict:
+        """
+        Get concurrency limiter statistics.
+
+        Returns:
+            dict: Statistics including:
+                - concurrency: Current AIMD concurrency value
+                - permits: Permits materialized in the semaphore
+                - max_concurrency: Configured hard cap
+                - target_latency: Latency goal in seconds
+                - avg_latency: Rolling average latency (0.0 if no calls)
+        """
+        with self._lock:
+            avg_latency = (
+                sum(self._latencies) / len(self._latencies)
+                if self._latencies else 0.0
+            )
+            return {
+                'concurrency': self._c,
+                'permits': self._permits,
+                'max_concurrency': self.max_concurrency,
+                'target_latency': self.target_latency,
+                'avg_latency': avg_latency
+            }
+
+
+class RetryPolicy:
+    """
+    Reusable retry state machine behind retry_on_rate_limit.
+
+    Keeps the retry configuration (max_retries, backoff_factor,
+    initial_wait) in one slotted object shared by every invocation of
+    a decorated function, instead of a fresh set of closure cells per
+    decoration. __slots__ makes the hot attribute reads in run()
+    cheap and the instance allocation-free beyond three floats.
+
+    Attributes:
+        max_retries (int): Maximum retry attempts
+        backoff_factor (float): Exponential wait multiplier
+        initial_wait (float): First retry wait in seconds
+
+    Example:
+        >>> policy = RetryPolicy(max_retries=3, backoff_factor=2.0)
+        >>> result = policy.run(call_api, query)
+    """
+
+    __slots__ = ('max_retries', 'backoff_factor', 'initial_wait')
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 2.0,
+        initial_wait: float = 1.0
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.initial_wait = initial_wait
+
+    def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call func, retrying on rate-limit errors per this policy.
+
+        Args:
+            func (Callable): Function to protect
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: func's return value
+
+        Raises:
+            Exception: Non-rate-limit errors immediately; the last
+                       rate-limit error once max_retries is exhausted
+        """
+        retries = 0
+        wait_time = self.initial_wait
+        max_retries = self.max_retries
+
+        while retries <= max_retries:
+            try:
+                # Attempt function call
+                result = func(*args, **kwargs)
+
+                # Log successful retry if this isn't first attempt
+                if retries > 0:
+                    logger.info(
+                        "[RateLimiter] ✓ Success after %d retry(ies) for %s",
+                        retries, func.__name__
+                    )
+
+                return result
+
+            except Exception as e:
+                error_str = str(e)
+                error_low = error_str.casefold()
+
+                # Check if it's a rate limit error: chained or
+                # short-circuits on the first hit (the common "429"
+                # case exits after one substring test) instead of
+                # building a list and running all four
+                is_rate_limit_error = (
+                    '429' in error_str
+                    or 'quota exceeded' in error_low
+                    or 'rate limit' in error_low
+                    or 'too many requests' in error_low
+                )
+
+                if not is_rate_limit_error:
+                    # Not a rate limit error - raise immediately
+                    raise
+
+                # Rate limit error detected
+                retries += 1
+
+                if retries > max_retries:
+                    logger.error(
+                        "[RateLimiter] ✗ Max retries (%d) exhausted for %s",
+                        max_retries, func.__name__
+                    )
+                    raise
+
+                # Try to extract suggested wait time from error
+                suggested_wait = self._extract_wait_time(error_str)
+                if suggested_wait:
+                    wait_time = suggested_wait + 1.0  # Add 1s buffer
+                    logger.info(
+                        "[RateLimiter] ⚠ Using suggested wait time: %.1fs",
+                        wait_time
+                    )
+
+                # Log retry attempt
+                logger.warning(
+                    "[RateLimiter] ⚠ Rate limit hit for %s. "
+                    "Retry %d/%d after %.1fs...",
+                    func.__name__, retries, max_retries, wait_time
+                )
+
+                # Equal jitter (AWS standard backoff guidance): half
+                # the wait is fixed, half uniformly random — the same
+                # expected delay, but K threads that hit 429 together
+                # no longer re-fire at the same instants on every
+                # subsequent attempt. The jittered wait then joins the
+                # shared pause deadline so concurrent callers coalesce
+                # on one pause instead of stacking independent sleeps.
+                jittered = wait_time * 0.5 + random.random() * (wait_time * 0.5)
+                remaining, adopted_shared = _join_shared_pause(jittered)
+                if remaining > 0:
+                    time.sleep(remaining)
+                if adopted_shared:
+                    # Callers who joined an existing deadline would
+                    # all thaw at the same instant — spread them out
+                    time.sleep(random.uniform(0.0, _RETRY_JITTER_MAX))
+
+                # Exponential backoff for next attempt
+                wait_time *= self.backoff_factor
+
+        # Should never reach here, but just in case
+        return None
+
+    async def run_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Async variant of run for coroutine functions.
+
+        Same retry state machine, but the coroutine is awaited and all
+        backoff sleeps go through asyncio.sleep so the event loop
+        keeps serving other coroutines while this one backs off.
+
+        Args:
+            func (Callable): Coroutine function to protect
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: func's awaited return value
+
+        Raises:
+            Exception: Non-rate-limit errors immediately; the last
+                       rate-limit error once max_retries is exhausted
+        """
+        retries = 0
+        wait_time = self.initial_wait
+        max_retries = self.max_retries
+
+        while retries <= max_retries:
+            try:
+                result = await func(*args, **kwargs)
+
+                if retries > 0:
+                    logger.info(
+                        "[RateLimiter] ✓ Success after %d retry(ies) for %s",
+                        retries, func.__name__
+                    )
+
+                return result
+
+            except Exception as e:
+                error_str = str(e)
+                error_low = error_str.casefold()
+
+                is_rate_limit_error = (
+                    '429' in error_str
+                    or 'quota exceeded' in error_low
+                    or 'rate limit' in error_low
+                    or 'too many requests' in error_low
+                )
+
+                if not is_rate_limit_error:
+                    raise
+
+                retries += 1
+
+                if retries > max_retries:
+                    logger.error(
+                        "[RateLimiter] ✗ Max retries (%d) exhausted for %s",
+                        max_retries, func.__name__
+                    )
+                    raise
+
+                suggested_wait = self._extract_wait_time(error_str)
+                if suggested_wait:
+                    wait_time = suggested_wait + 1.0  # Add 1s buffer
+                    logger.info(
+                        "[RateLimiter] ⚠ Using suggested wait time: %.1fs",
+                        wait_time
+                    )
+
+                logger.warning(
+                    "[RateLimiter] ⚠ Rate limit hit for %s. "
+                    "Retry %d/%d after %.1fs...",
+                    func.__name__, retries, max_retries, wait_time
+                )
+
+                # Equal jitter plus the shared pause deadline, exactly
+                # as in run(), but awaited instead of slept
+                jittered = wait_time * 0.5 + random.random() * (wait_time * 0.5)
+                remaining, adopted_shared = _join_shared_pause(jittered)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                if adopted_shared:
+                    await asyncio.sleep(random.uniform(0.0, _RETRY_JITTER_MAX))
+
+                wait_time *= self.backoff_factor
+
+        # Should never reach here, but just in case
+        return None
+
+    @staticmethod
+    def _extract_wait_time(error_message: str) -> Optional[float]:
+        """
+        Extract suggested wait time from error message.
+
+        Args:
+            error_message (str): Error message to parse
+
+        Returns:
+            Optional[float]: Extracted wait time in seconds, or None
+
+        Patterns Matched:
+            - "retry in 5s"
+            - "retry after 5 seconds"
+            - "wait 5.5s"
+            - "retry in 5.0 seconds"
+
+        Example:
+            >>> RetryPolicy._extract_wait_time("Rate limit exceeded. Retry in 5s")
+            5.0
+            >>> RetryPolicy._extract_wait_time("Unknown error")
+
+        """
+        match = _WAIT_RE.search(error_message)
+        return float(match.group(1)) if match else None
 
 
 def retry_on_rate_limit(
@@ -236,189 +919,138 @@ def retry_on_rate_limit(
 ) -> Callable:
     """
     Decorator for automatic retry with exponential backoff on rate limit errors.
-    
+
     This decorator wraps functions to automatically retry when rate limit
-    errors occur. It implements intelligent exponential backoff and can
-    extract suggested wait times from error messages.
-    
+    errors occur. The retry loop itself lives on RetryPolicy; each use of
+    this decorator builds one shared policy object and returns thin
+    wrappers that delegate to it.
+
     Key Features:
-    
+
     1. Automatic Retry:
        - Detects rate limit errors (429 status, quota messages)
        - Retries up to max_retries times
        - Raises original error after max attempts
-    
+
     2. Exponential Backoff:
        - Wait time increases exponentially: 1s, 2s, 4s, 8s...
        - Prevents thundering herd problem
        - Configurable backoff factor
-    
+
     3. Smart Wait Extraction:
        - Parses "Retry after X seconds" from errors
        - Adds buffer to suggested wait times
        - Falls back to exponential backoff if not found
-    
+
     Args:
         max_retries (int): Maximum retry attempts (default: 3)
         backoff_factor (float): Exponential multiplier (default: 2.0)
         initial_wait (float): First retry wait time in seconds (default: 1.0)
-    
+
     Returns:
         Callable: Decorated function with retry logic
-    
+
     Error Detection:
         Catches rate limit errors by checking for:
         - "429" (HTTP Too Many Requests)
         - "quota exceeded" (case-insensitive)
         - "rate limit" (case-insensitive)
-    
+
     Wait Time Calculation:
         1. Check error message for "retry in Xs" or "retry after Xs"
         2. If found: use that time + 1 second buffer
         3. If not found: use exponential backoff
-        
+
         Backoff formula: wait_time = initial_wait * (backoff_factor ^ retry_count)
-    
+
     Example Usage:
         >>> @retry_on_rate_limit(max_retries=3, backoff_factor=2)
         ... def call_api():
         ...     return gemini.generate_content(prompt)
-        
+
         >>> # Custom configuration
         >>> @retry_on_rate_limit(max_retries=5, backoff_factor=1.5, initial_wait=2.0)
         ... def critical_api_call():
         ...     return important_operation()
-        
+
         >>> # Usage
         >>> try:
         ...     result = call_api()
         ... except Exception as e:
         ...     print(f"Failed after retries: {e}")
-    
+
     Logging:
         - Logs each retry attempt with wait time
         - Logs max retry exhaustion
         - Logs successful retry recovery
-    
+
     Thread Safety:
         Decorator itself is thread-safe. However, if the wrapped function
         modifies shared state, external synchronization is required.
     """
+    # One slotted policy shared by every invocation of every function
+    # this decorator instance wraps; the wrapper below stays a plain
+    # function (not functools.partial) so it still works as a method
+    # through the descriptor protocol
+    policy = RetryPolicy(max_retries, backoff_factor, initial_wait)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            retries = 0
-            wait_time = initial_wait
-            
-            while retries <= max_retries:
-                try:
-                    # Attempt function call
-                    result = func(*args, **kwargs)
-                    
-                    # Log successful retry if this isn't first attempt
-                    if retries > 0:
-                        logging.info(
-                            f"[RateLimiter] ✓ Success after {retries} retry(ies) "
-                            f"for {func.__name__}"
-                        )
-                    
-                    return result
-                
-                except Exception as e:
-                    error_str = str(e).lower()
-                    
-                    # Check if it's a rate limit error
-                    is_rate_limit_error = any([
-                        '429' in str(e),
-                        'quota exceeded' in error_str,
-                        'rate limit' in error_str,
-                        'too many requests' in error_str
-                    ])
-                    
-                    if not is_rate_limit_error:
-                        # Not a rate limit error - raise immediately
-                        raise
-                    
-                    # Rate limit error detected
-                    retries += 1
-                    
-                    if retries > max_retries:
-                        logging.error(
-                            f"[RateLimiter] ✗ Max retries ({max_retries}) exhausted "
-                            f"for {func.__name__}"
-                        )
-                        raise
-                    
-                    # Try to extract suggested wait time from error
-                    suggested_wait = _extract_wait_time(str(e))
-                    if suggested_wait:
-                        wait_time = suggested_wait + 1.0  # Add 1s buffer
-                        logging.info(
-                            f"[RateLimiter] ⚠ Using suggested wait time: {wait_time:.1f}s"
-                        )
-                    
-                    # Log retry attempt
-                    logging.warning(
-                        f"[RateLimiter] ⚠ Rate limit hit for {func.__name__}. "
-                        f"Retry {retries}/{max_retries} after {wait_time:.1f}s..."
-                    )
-                    
-                    # Wait before retry
-                    time.sleep(wait_time)
-                    
-                    # Exponential backoff for next attempt
-                    wait_time *= backoff_factor
-            
-            # Should never reach here, but just in case
-            return None
-        
+            return policy.run(func, *args, **kwargs)
+
+        wrapper.retry_policy = policy
         return wrapper
     return decorator
 
 
-def _extract_wait_time(error_message: str) -> Optional[float]:
+def retry_on_rate_limit_async(
+    max_retries: int = 3,
+    backoff_factor: float = 2.0,
+    initial_wait: float = 1.0
+) -> Callable:
     """
-    Extract suggested wait time from error message.
-    
+    Async sibling of retry_on_rate_limit for coroutine functions.
+
+    Wraps a coroutine function with the same rate-limit retry loop as
+    retry_on_rate_limit, but backoff pauses are awaited through
+    asyncio.sleep so the event loop stays responsive while a call
+    backs off.
+
     Args:
-        error_message (str): Error message to parse
-    
+        max_retries (int): Maximum retry attempts (default: 3)
+        backoff_factor (float): Exponential multiplier (default: 2.0)
+        initial_wait (float): First retry wait time in seconds (default: 1.0)
+
     Returns:
-        Optional[float]: Extracted wait time in seconds, or None
-    
-    Patterns Matched:
-        - "retry in 5s"
-        - "retry after 5 seconds"
-        - "wait 5.5s"
-        - "retry in 5.0 seconds"
-    
-    Example:
-        >>> _extract_wait_time("Rate limit exceeded. Retry in 5s")
-        5.0
-        >>> _extract_wait_time("Quota exceeded. Retry after 10.5 seconds")
-        10.5
-        >>> _extract_wait_time("Unknown error")
-        None
+        Callable: Decorated coroutine function with retry logic
+
+    Example Usage:
+        >>> @retry_on_rate_limit_async(max_retries=3, backoff_factor=2)
+        ... async def call_api():
+        ...     return await gemini.generate_content_async(prompt)
     """
-    patterns = [
-        r'retry in (\d+\.?\d*)\s*s',
-        r'retry after (\d+\.?\d*)\s*s',
-        r'wait (\d+\.?\d*)\s*s',
-        r'retry in (\d+\.?\d*)\s*seconds?',
-        r'retry after (\d+\.?\d*)\s*seconds?'
-    ]
-    
-    error_lower = error_message.lower()
-    
-    for pattern in patterns:
-        match = re.search(pattern, error_lower)
-        if match:
-            try:
-                return float(match.group(1))
-            except (ValueError, IndexError):
-                continue
-    
-    return None
+    policy = RetryPolicy(max_retries, backoff_factor, initial_wait)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            return await policy.run_async(func, *args, **kwargs)
+
+        wrapper.retry_policy = policy
+        return wrapper
+    return decorator
+
+
+# Pre-built decorator for the ubiquitous default configuration
+# (max_retries=3, backoff_factor=2.0, initial_wait=1.0). Apply as
+# @retry_default — no factory call at definition time, and every
+# default-configured call site shares one RetryPolicy instance.
+retry_default = retry_on_rate_limit()
+
+
+# Retained module-level alias; the implementation lives on RetryPolicy
+_extract_wait_time = RetryPolicy._extract_wait_time
 
 
 # Global rate limiter singleton
@@ -441,8 +1073,10 @@ def get_rate_limiter(requests_per_minute: int = 10) -> RateLimiter:
         RateLimiter: Global rate limiter instance
     
     Thread Safety:
-        Thread-safe initialization using Lock. Multiple threads calling
-        this function simultaneously will safely get the same instance.
+        Double-checked locking: after first construction the fast path
+        is a single is-None test with no lock acquisition (module-name
+        assignment is atomic in CPython), and the lock only guards the
+        one-time construction race.
     
     Note:
         The requests_per_minute parameter only takes effect on the first
@@ -467,12 +1101,17 @@ def get_rate_limiter(requests_per_minute: int = 10) -> RateLimiter:
         >>> limiter.wait_if_needed()
     """
     global _global_rate_limiter
-    
+
+    # Fast path: no lock once the singleton exists
+    limiter = _global_rate_limiter
+    if limiter is not None:
+        return limiter
+
     with _global_lock:
         if _global_rate_limiter is None:
             _global_rate_limiter = RateLimiter(requests_per_minute)
-            logging.info("[RateLimiter] ✓ Global instance created")
-        
+            logger.info("[RateLimiter] ✓ Global instance created")
+
         return _global_rate_limiter
 
 
@@ -493,11 +1132,17 @@ def reset_global_rate_limiter() -> None:
     
     with _global_lock:
         _global_rate_limiter = None
-        logging.info("[RateLimiter] ✓ Global instance reset")
+        logger.info("[RateLimiter] ✓ Global instance reset")
 
 
 if __name__ == "__main__":
-    # Demo/testing code
+    # Demo/testing code — configure logging here, where it's an
+    # application decision rather than a library import side effect
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     print("RateLimiter Demo")
     print("=" * 60)
     